@@ -0,0 +1,43 @@
+"""Benchmark per-line vs batch keyword handlers on 5k keyword lines."""
+
+import time
+
+import hyprlang_pybind as hyprlang
+
+LINES = 5000
+ROUNDS = 20
+
+
+def make_config() -> str:
+    return "\n".join(f"bind = SUPER, {i}, exec, cmd{i}" for i in range(LINES))
+
+
+def bench(text: str, batch: bool) -> float:
+    config = hyprlang.Config(text, is_stream=True)
+    seen = []
+    if batch:
+        config.on_keyword("bind", seen.extend, batch=True)
+    else:
+        config.on_keyword("bind", lambda cmd, val: seen.append((cmd, val)))
+    config.commence()
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        seen.clear()
+        config.parse()
+    elapsed = (time.perf_counter() - start) / ROUNDS
+    assert len(seen) == LINES
+    return elapsed
+
+
+def main():
+    text = make_config()
+    per_line = bench(text, batch=False)
+    batch = bench(text, batch=True)
+    print(f"{LINES} keyword lines, mean of {ROUNDS} parses")
+    print(f"  per-line handler: {per_line * 1000:8.2f} ms")
+    print(f"  batch handler:    {batch * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Benchmark ConfigPool.parse_string against per-call parse_string."""
+
+import time
+
+import hyprlang_pybind as hyprlang
+
+KEYS = 2000
+ROUNDS = 500
+
+SCHEMA = {
+    f"section{i // 50}": {f"key{j}": 0 for j in range(50)} for i in range(0, KEYS, 50)
+}
+SNIPPET = "section0:key1 = 5\nsection3:key7 = 9\n"
+
+
+def bench(parse) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        parse(SNIPPET)
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def main():
+    schema = hyprlang.Schema(SCHEMA)
+    pool = hyprlang.ConfigPool(schema, size=4)
+
+    per_call_dict = bench(lambda text: hyprlang.parse_string(text, schema=SCHEMA))
+    per_call = bench(lambda text: hyprlang.parse_string(text, schema=schema))
+    pooled = bench(pool.parse_string)
+
+    print(f"{KEYS}-key schema, small snippet, mean of {ROUNDS} parses")
+    print(f"  parse_string (dict schema):   {per_call_dict * 1e6:9.1f} us")
+    print(f"  parse_string (Schema):        {per_call * 1e6:9.1f} us")
+    print(f"  ConfigPool.parse_string:      {pooled * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
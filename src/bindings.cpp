@@ -2,11 +2,31 @@
 #include <pybind11/stl.h>
 #include <pybind11/functional.h>
 #include <hyprlang.hpp>
+#include <algorithm>
 #include <any>
+#include <cctype>
+#include <cstring>
+#include <optional>
 #include <stdexcept>
 #include <string>
+#include <string_view>
+#include <unordered_map>
+#include <unordered_set>
+#include <utility>
 #include <vector>
 #include <filesystem>
+#include <fstream>
+#include <list>
+#include <memory>
+#include <mutex>
+#include <cstdlib>
+#include <glob.h>
+#ifdef __linux__
+#include <cerrno>
+#include <poll.h>
+#include <sys/inotify.h>
+#include <unistd.h>
+#endif
 
 namespace py = pybind11;
 
@@ -34,11 +54,1744 @@ static py::object anyToPython(const std::any& val) {
     return py::none();
 }
 
+enum class eValueType {
+    NONE,
+    INT,
+    FLOAT,
+    STRING,
+    VEC2,
+    OTHER,
+};
+
+static eValueType valueTypeOf(const std::any& val) {
+    if (!val.has_value())
+        return eValueType::NONE;
+    const auto& t = val.type();
+    if (t == typeid(int64_t))
+        return eValueType::INT;
+    if (t == typeid(float))
+        return eValueType::FLOAT;
+    if (t == typeid(const char*))
+        return eValueType::STRING;
+    if (t == typeid(Hyprlang::SVector2D))
+        return eValueType::VEC2;
+    return eValueType::OTHER;
+}
+
+// Reads a value straight from CConfigValue's data pointer, skipping the
+// std::any round trip of getValue().
+static py::object dataToPython(void* data, eValueType type) {
+    switch (type) {
+        case eValueType::INT: return py::int_(*static_cast<int64_t*>(data));
+        case eValueType::FLOAT: return py::float_(*static_cast<float*>(data));
+        case eValueType::STRING: return py::str(static_cast<const char*>(data));
+        case eValueType::VEC2: {
+            auto* v = static_cast<Hyprlang::SVector2D*>(data);
+            return py::make_tuple(v->x, v->y);
+        }
+        default: return py::none();
+    }
+}
+
+// Converts a Python default into a CConfigValue and hands it to sink. Strings
+// are passed as borrowed UTF-8 buffers; CConfigValue copies them.
+template <typename F>
+static void withConfigValue(const py::handle& val, F&& sink) {
+    PyObject* obj = val.ptr();
+    if (PyLong_Check(obj)) {
+        auto i = PyLong_AsLongLong(obj);
+        if (i == -1 && PyErr_Occurred())
+            throw py::error_already_set();
+        sink(Hyprlang::CConfigValue((Hyprlang::INT)i));
+    } else if (PyFloat_Check(obj)) {
+        sink(Hyprlang::CConfigValue((Hyprlang::FLOAT)PyFloat_AS_DOUBLE(obj)));
+    } else if (PyUnicode_Check(obj)) {
+        const char* str = PyUnicode_AsUTF8(obj);
+        if (!str)
+            throw py::error_already_set();
+        sink(Hyprlang::CConfigValue((Hyprlang::STRING)str));
+    } else if (py::isinstance<Hyprlang::SVector2D>(val)) {
+        sink(Hyprlang::CConfigValue(val.cast<Hyprlang::SVector2D>()));
+    } else if (PyTuple_Check(obj) && PyTuple_GET_SIZE(obj) == 2) {
+        Hyprlang::SVector2D vec{py::handle(PyTuple_GET_ITEM(obj, 0)).cast<float>(), py::handle(PyTuple_GET_ITEM(obj, 1)).cast<float>()};
+        sink(Hyprlang::CConfigValue(vec));
+    } else {
+        throw std::invalid_argument("Unsupported default value type. Use int, float, str, SVector2D, or tuple(float, float).");
+    }
+}
+
+// Calls fn(name, default) for either an iterable of (name, default) pairs or,
+// when defaults is given, two parallel sequences.
+template <typename F>
+static void forEachDefault(const py::handle& values, const py::object& defaults, F&& fn) {
+    if (defaults.is_none()) {
+        for (auto item : py::iter(values)) {
+            auto pair = py::reinterpret_borrow<py::sequence>(item);
+            if (py::len(pair) != 2)
+                throw std::invalid_argument("Expected (name, default) pairs");
+            fn(pair[0].cast<std::string>(), pair[1]);
+        }
+        return;
+    }
+    auto names = py::reinterpret_borrow<py::sequence>(values);
+    auto defs  = py::reinterpret_borrow<py::sequence>(defaults);
+    if (py::len(names) != py::len(defs))
+        throw std::invalid_argument("defaults must have the same length as names");
+    for (size_t i = 0; i < py::len(names); ++i)
+        fn(names[i].cast<std::string>(), defs[i]);
+}
+
+// A plain copy of a value's data, used to tell whether it changed and to
+// put it back.
+struct SRawValue {
+    eValueType          type       = eValueType::NONE;
+    int64_t             intValue   = 0;
+    float               floatValue = 0;
+    Hyprlang::SVector2D vecValue;
+    std::string         strValue;
+
+    bool matches(void* data) const {
+        switch (type) {
+            case eValueType::INT: return intValue == *static_cast<int64_t*>(data);
+            case eValueType::FLOAT: return std::memcmp(&floatValue, data, sizeof(float)) == 0;
+            case eValueType::STRING: return strValue == static_cast<const char*>(data);
+            case eValueType::VEC2: return vecValue == *static_cast<Hyprlang::SVector2D*>(data);
+            default: return false;
+        }
+    }
+
+    void remember(void* data) {
+        switch (type) {
+            case eValueType::INT: intValue = *static_cast<int64_t*>(data); break;
+            case eValueType::FLOAT: floatValue = *static_cast<float*>(data); break;
+            case eValueType::STRING: strValue = static_cast<const char*>(data); break;
+            case eValueType::VEC2: vecValue = *static_cast<Hyprlang::SVector2D*>(data); break;
+            default: break;
+        }
+    }
+};
+
+// The last Python object built for a CConfigValue, with a copy of the raw
+// value it was built from so a later read can tell whether it is still valid.
+struct SCachedValue : SRawValue {
+    py::object object;
+};
+
+// A contiguous, typed array exposed through the buffer protocol, so NumPy
+// (or memoryview) can wrap it without copying.
+class CNumericBuffer {
+  public:
+    template <typename T>
+    static CNumericBuffer make(std::vector<T> values, size_t width = 1) {
+        CNumericBuffer buf;
+        buf.m_format   = py::format_descriptor<T>::format();
+        buf.m_itemSize = sizeof(T);
+        buf.m_rows     = width ? values.size() / width : 0;
+        buf.m_width    = width;
+        buf.m_data.resize(values.size() * sizeof(T));
+        if (!values.empty())
+            std::memcpy(buf.m_data.data(), values.data(), buf.m_data.size());
+        return buf;
+    }
+
+    py::buffer_info info() {
+        std::vector<py::ssize_t> shape   = {(py::ssize_t)m_rows};
+        std::vector<py::ssize_t> strides = {(py::ssize_t)(m_itemSize * m_width)};
+        if (m_width > 1) {
+            shape.push_back((py::ssize_t)m_width);
+            strides.push_back((py::ssize_t)m_itemSize);
+        }
+        return py::buffer_info(m_data.data(), (py::ssize_t)m_itemSize, m_format, (py::ssize_t)shape.size(), shape, strides, true);
+    }
+
+    size_t rows() const {
+        return m_rows;
+    }
+
+  private:
+    std::vector<unsigned char> m_data;
+    std::string                m_format;
+    size_t                     m_itemSize = 0;
+    size_t                     m_rows     = 0;
+    size_t                     m_width    = 1;
+};
+
+// Numeric values split by type, each with the keys in buffer order.
+struct NumericExport {
+    py::object ints;
+    py::list   intKeys;
+    py::object floats;
+    py::list   floatKeys;
+    py::object vec2s;
+    py::list   vec2Keys;
+};
+
 struct ConfigValueProxy {
     py::object value;
     bool       setByUser;
 };
 
+// One level of the nested snapshot: either a leaf indexing into the flat key
+// list, or a category holding further nodes. Segment names are kept as Python
+// strings so snapshots never re-split or re-encode keys.
+struct SnapshotNode {
+    std::string               segment;
+    py::str                   name;
+    bool                      leaf  = false;
+    size_t                    index = 0;
+    std::vector<SnapshotNode> children;
+};
+
+// The key-path tree for a list of colon-separated keys. It holds no values,
+// so one layout can be shared by every Config built from the same schema.
+struct SSnapshotLayout {
+    std::vector<std::string>                     keys;
+    std::vector<py::str>                         names;
+    std::vector<std::vector<py::str>>            paths;   // nested-dict path of each key
+    std::unordered_multimap<std::string, size_t> indices; // position of each key
+    SnapshotNode                                 root;
+
+    static std::shared_ptr<const SSnapshotLayout> build(std::vector<std::string> keys) {
+        auto layout = std::make_shared<SSnapshotLayout>();
+        layout->keys = std::move(keys);
+        for (size_t i = 0; i < layout->keys.size(); ++i) {
+            const auto& key = layout->keys[i];
+            layout->names.emplace_back(key);
+            layout->indices.emplace(key, i);
+            auto& path = layout->paths.emplace_back();
+
+            SnapshotNode* node  = &layout->root;
+            size_t        start = 0;
+            while (true) {
+                size_t      end     = key.find(':', start);
+                std::string segment = key.substr(start, end == std::string::npos ? std::string::npos : end - start);
+                bool        leaf    = end == std::string::npos;
+
+                SnapshotNode* child = nullptr;
+                for (auto& c : node->children) {
+                    if (c.segment == segment && c.leaf == leaf) {
+                        child = &c;
+                        break;
+                    }
+                }
+                if (!child) {
+                    node->children.push_back(SnapshotNode{segment, py::str(segment)});
+                    child = &node->children.back();
+                }
+                path.push_back(child->name);
+                if (leaf) {
+                    child->leaf  = true;
+                    child->index = i;
+                    break;
+                }
+                node  = child;
+                start = end + 1;
+            }
+        }
+        return layout;
+    }
+};
+
+// SpecialCategoryOptions as seen from Python. The key is kept here rather
+// than as a raw pointer; the Config copies it into its own arena when the
+// category is registered.
+struct SPySpecialCategoryOptions : Hyprlang::SSpecialCategoryOptions {
+    std::optional<std::string> ownedKey;
+};
+
+// A default value whose Python type has already been checked, so it can be
+// registered again without touching Python.
+struct SDefaultValue {
+    eValueType          type = eValueType::NONE;
+    int64_t             intValue   = 0;
+    float               floatValue = 0;
+    std::string         strValue;
+    Hyprlang::SVector2D vecValue;
+};
+
+static SDefaultValue toDefaultValue(const py::handle& val) {
+    SDefaultValue out;
+    withConfigValue(val, [&](const Hyprlang::CConfigValue& value) {
+        auto any = value.getValue();
+        out.type = valueTypeOf(any);
+        switch (out.type) {
+            case eValueType::INT: out.intValue = std::any_cast<int64_t>(any); break;
+            case eValueType::FLOAT: out.floatValue = std::any_cast<float>(any); break;
+            case eValueType::STRING: out.strValue = std::any_cast<const char*>(any); break;
+            case eValueType::VEC2: out.vecValue = std::any_cast<Hyprlang::SVector2D>(any); break;
+            default: break;
+        }
+    });
+    return out;
+}
+
+template <typename F>
+static void withConfigValue(const SDefaultValue& val, F&& sink) {
+    switch (val.type) {
+        case eValueType::INT: sink(Hyprlang::CConfigValue((Hyprlang::INT)val.intValue)); break;
+        case eValueType::FLOAT: sink(Hyprlang::CConfigValue((Hyprlang::FLOAT)val.floatValue)); break;
+        case eValueType::STRING: sink(Hyprlang::CConfigValue((Hyprlang::STRING)val.strValue.c_str())); break;
+        case eValueType::VEC2: sink(Hyprlang::CConfigValue(val.vecValue)); break;
+        default: throw std::invalid_argument("Unsupported default value type.");
+    }
+}
+
+static py::object defaultToPython(const SDefaultValue& val) {
+    switch (val.type) {
+        case eValueType::INT: return py::int_(val.intValue);
+        case eValueType::FLOAT: return py::float_(val.floatValue);
+        case eValueType::STRING: return py::str(val.strValue);
+        case eValueType::VEC2: return py::make_tuple(val.vecValue.x, val.vecValue.y);
+        default: return py::none();
+    }
+}
+
+static bool isAsciiSpace(char c) {
+    return c == ' ' || c == '\t' || c == '\n' || c == '\r' || c == '\f' || c == '\v';
+}
+
+static bool isAsciiDigit(char c) {
+    return c >= '0' && c <= '9';
+}
+
+static std::string_view stripView(std::string_view s) {
+    while (!s.empty() && isAsciiSpace(s.front()))
+        s.remove_prefix(1);
+    while (!s.empty() && isAsciiSpace(s.back()))
+        s.remove_suffix(1);
+    return s;
+}
+
+// Advances over `-?\d+\.?\d*` at pos; false (pos unchanged) if absent.
+static bool scanLooseNumber(std::string_view v, size_t& pos) {
+    size_t i = pos;
+    if (i < v.size() && v[i] == '-')
+        ++i;
+    size_t digits = i;
+    while (i < v.size() && isAsciiDigit(v[i]))
+        ++i;
+    if (i == digits)
+        return false;
+    if (i < v.size() && v[i] == '.')
+        ++i;
+    while (i < v.size() && isAsciiDigit(v[i]))
+        ++i;
+    pos = i;
+    return true;
+}
+
+// Classifies a stripped raw value as the default type hyprlang would need,
+// checking bool words, int/hex, rgb()/rgba(), float and vec2 in that order.
+// Each shape is a single forward scan, so there is no backtracking.
+static eValueType inferValueType(std::string_view v) {
+    if (v.size() >= 2 && v.size() <= 5) {
+        char lower[5];
+        for (size_t i = 0; i < v.size(); ++i)
+            lower[i] = (v[i] >= 'A' && v[i] <= 'Z') ? v[i] - 'A' + 'a' : v[i];
+        std::string_view word(lower, v.size());
+        if (word == "true" || word == "false" || word == "yes" || word == "no" || word == "on" || word == "off")
+            return eValueType::INT;
+    }
+
+    if (v.size() > 2 && v[0] == '0' && v[1] == 'x' &&
+        std::all_of(v.begin() + 2, v.end(), [](char c) { return std::isxdigit(static_cast<unsigned char>(c)) != 0; }))
+        return eValueType::INT;
+
+    size_t i        = v.starts_with('-') ? 1 : 0;
+    size_t intStart = i;
+    while (i < v.size() && isAsciiDigit(v[i]))
+        ++i;
+    size_t intDigits = i - intStart;
+    if (i == v.size() && intDigits > 0)
+        return eValueType::INT;
+
+    if (v.starts_with("rgb(") || v.starts_with("rgba("))
+        return eValueType::INT;
+
+    if (i < v.size() && v[i] == '.') {
+        size_t j = i + 1;
+        while (j < v.size() && isAsciiDigit(v[j]))
+            ++j;
+        if (j == v.size() && (intDigits > 0 || j > i + 1))
+            return eValueType::FLOAT;
+    }
+
+    size_t pos = 0;
+    if (scanLooseNumber(v, pos) && pos < v.size() && isAsciiSpace(v[pos])) {
+        while (pos < v.size() && isAsciiSpace(v[pos]))
+            ++pos;
+        if (scanLooseNumber(v, pos) && pos == v.size())
+            return eValueType::VEC2;
+    }
+    return eValueType::STRING;
+}
+
+using InferredKeys = std::vector<std::pair<std::string, eValueType>>;
+
+// A `$name = value` or `source = path` line, with how many keys came before
+// it. Sources have no name.
+struct SScanDirective {
+    size_t      position = 0;
+    std::string name;
+    std::string value;
+};
+
+// What one scan of a text finds: its keys and its directives, in order.
+struct SInferredText {
+    InferredKeys                keys;
+    std::vector<SScanDirective> directives;
+};
+
+// Scans hyprlang text for `key = value` lines and infers a flat schema of
+// colon-joined keys, in first-seen order. Comments are skipped; category
+// blocks nest keys. Variable and source lines are kept as directives.
+static SInferredText scanText(std::string_view text) {
+    SInferredText                           out;
+    auto&                                   schema = out.keys;
+    std::unordered_map<std::string, size_t> index;
+    std::vector<std::string>                categories;
+
+    while (!text.empty()) {
+        size_t           eol  = text.find('\n');
+        std::string_view line = text.substr(0, eol);
+        text.remove_prefix(eol == std::string_view::npos ? text.size() : eol + 1);
+
+        line = stripView(line.substr(0, line.find('#')));
+        if (line.empty())
+            continue;
+        if (line.starts_with('$')) {
+            size_t eq = line.find('=');
+            auto   name = stripView(line.substr(1, eq == std::string_view::npos ? std::string_view::npos : eq - 1));
+            if (eq != std::string_view::npos && !name.empty())
+                out.directives.push_back({schema.size(), std::string(name), std::string(stripView(line.substr(eq + 1)))});
+            continue;
+        }
+
+        if (line.ends_with('{')) {
+            auto name = stripView(line.substr(0, line.size() - 1));
+            name      = stripView(name.substr(0, name.find('[')));
+            if (!name.empty())
+                categories.emplace_back(name);
+            continue;
+        }
+        if (line == "}") {
+            if (!categories.empty())
+                categories.pop_back();
+            continue;
+        }
+
+        size_t eq = line.find('=');
+        if (eq == std::string_view::npos)
+            continue;
+        auto key   = stripView(line.substr(0, eq));
+        auto value = stripView(line.substr(eq + 1));
+        if (key == "source") {
+            if (!value.empty())
+                out.directives.push_back({schema.size(), {}, std::string(value)});
+            continue;
+        }
+        if (key.empty() || value.empty())
+            continue;
+
+        std::string fullKey;
+        for (const auto& category : categories)
+            fullKey.append(category).push_back(':');
+        fullKey.append(key);
+
+        auto type = inferValueType(value);
+        if (auto it = index.find(fullKey); it != index.end())
+            schema[it->second].second = type;
+        else {
+            index.emplace(fullKey, schema.size());
+            schema.emplace_back(std::move(fullKey), type);
+        }
+    }
+    return out;
+}
+
+// A file's scan, memoized process-wide by path, mtime and size, so an
+// include shared by many root configs is read and scanned once. The memo
+// is an LRU of the INFERRED_FILES_MAX most recently used files.
+struct SInferredFile {
+    std::filesystem::file_time_type mtime;
+    uintmax_t                       size = 0;
+    SInferredText                   text;
+};
+
+class CInferredFileMemo {
+  public:
+    std::shared_ptr<const SInferredFile> find(const std::string& path, std::filesystem::file_time_type mtime, uintmax_t size) {
+        std::lock_guard lock(m_mutex);
+        auto            it = m_entries.find(path);
+        if (it == m_entries.end() || it->second.file->mtime != mtime || it->second.file->size != size)
+            return nullptr;
+        m_order.splice(m_order.begin(), m_order, it->second.position);
+        return it->second.file;
+    }
+
+    void store(const std::string& path, std::shared_ptr<const SInferredFile> file) {
+        std::lock_guard lock(m_mutex);
+        if (auto it = m_entries.find(path); it != m_entries.end()) {
+            it->second.file = std::move(file);
+            m_order.splice(m_order.begin(), m_order, it->second.position);
+            return;
+        }
+        if (m_entries.size() >= INFERRED_FILES_MAX) {
+            m_entries.erase(m_order.back());
+            m_order.pop_back();
+        }
+        m_order.push_front(path);
+        m_entries.emplace(path, SEntry{std::move(file), m_order.begin()});
+    }
+
+    static constexpr size_t INFERRED_FILES_MAX = 256;
+
+  private:
+    struct SEntry {
+        std::shared_ptr<const SInferredFile> file;
+        std::list<std::string>::iterator     position;
+    };
+
+    std::mutex                              m_mutex;
+    std::list<std::string>                  m_order; // most recently used first
+    std::unordered_map<std::string, SEntry> m_entries;
+};
+
+static CInferredFileMemo g_inferredFiles;
+
+// Returns nullptr if the file can't be read.
+static std::shared_ptr<const SInferredFile> scanFile(const std::string& path) {
+    std::error_code ec;
+    const auto      mtime = std::filesystem::last_write_time(path, ec);
+    if (ec)
+        return nullptr;
+    const auto size = std::filesystem::file_size(path, ec);
+    if (ec)
+        return nullptr;
+    if (auto cached = g_inferredFiles.find(path, mtime, size))
+        return cached;
+
+    std::ifstream file(path, std::ios::binary);
+    if (!file)
+        return nullptr;
+    std::string content{std::istreambuf_iterator<char>(file), std::istreambuf_iterator<char>()};
+    auto        entry = std::make_shared<const SInferredFile>(SInferredFile{mtime, size, scanText(content)});
+    g_inferredFiles.store(path, entry);
+    return entry;
+}
+
+// Expands a `source =` target like hyprlang: a leading `~` is $HOME,
+// relative paths start at the directory of the file with the source line,
+// and globs expand to their sorted matches.
+static std::vector<std::string> resolveSource(const std::string& target, const std::filesystem::path& base) {
+    std::string path = target;
+    if (path == "~" || path.starts_with("~/")) {
+        if (const char* home = std::getenv("HOME"))
+            path = home + path.substr(1);
+    }
+    const auto full = (base / path).lexically_normal().string();
+    if (full.find_first_of("*?[") == std::string::npos)
+        return {full};
+
+    std::vector<std::string> matches;
+    glob_t                   found{};
+    if (glob(full.c_str(), 0, nullptr, &found) == 0) {
+        for (size_t i = 0; i < found.gl_pathc; ++i)
+            matches.push_back(std::filesystem::path(found.gl_pathv[i]).lexically_normal().string());
+    }
+    globfree(&found);
+    return matches;
+}
+
+// Walks a config and everything it sources, transitively and in document
+// order, the way libhyprlang parses it: `$VAR`s defined so far are expanded
+// in source paths, and each file's relative sources start at its own
+// directory. Collects the schema, with sourced keys spliced in where their
+// `source =` line is, and the include graph: each file read, in visiting
+// order, with the files it sources. `files` lists every file the walk tried
+// to read, readable or not. A file is expanded once, and one that can't be
+// read adds nothing to the schema or the graph. In stream mode the root is
+// the text itself, which has no entry, and its sources start at the working
+// directory.
+struct SInferredSchema {
+    InferredKeys                                                   keys;
+    std::vector<std::pair<std::string, std::vector<std::string>>> graph;
+    std::vector<std::string>                                       files;
+};
+
+class CSchemaInference {
+  public:
+    static SInferredSchema run(const std::string& root, bool isStream) {
+        CSchemaInference inference;
+        std::error_code  ec;
+        if (isStream)
+            inference.expand(scanText(root), std::filesystem::current_path(ec), std::nullopt);
+        else
+            inference.visit(std::filesystem::absolute(root, ec).lexically_normal().string());
+        return std::move(inference.m_result);
+    }
+
+  private:
+    void visit(const std::string& path) {
+        if (!m_visited.insert(path).second)
+            return;
+        m_result.files.push_back(path);
+        const auto file = scanFile(path);
+        if (!file)
+            return;
+        const size_t node = m_result.graph.size();
+        m_result.graph.emplace_back(path, std::vector<std::string>{});
+        expand(file->text, std::filesystem::path(path).parent_path(), node);
+    }
+
+    void expand(const SInferredText& text, const std::filesystem::path& base, std::optional<size_t> node) {
+        size_t next = 0;
+        for (const auto& directive : text.directives) {
+            for (; next < directive.position; ++next)
+                add(text.keys[next]);
+            if (!directive.name.empty()) {
+                define(directive.name, substitute(directive.value));
+                continue;
+            }
+            for (auto& child : resolveSource(substitute(directive.value), base)) {
+                if (node)
+                    m_result.graph[*node].second.push_back(child);
+                visit(child);
+            }
+        }
+        for (; next < text.keys.size(); ++next)
+            add(text.keys[next]);
+    }
+
+    void add(const std::pair<std::string, eValueType>& key) {
+        if (auto it = m_index.find(key.first); it != m_index.end())
+            m_result.keys[it->second].second = key.second;
+        else {
+            m_index.emplace(key.first, m_result.keys.size());
+            m_result.keys.push_back(key);
+        }
+    }
+
+    void define(const std::string& name, std::string value) {
+        auto it = std::ranges::find(m_variables, name, &std::pair<std::string, std::string>::first);
+        if (it != m_variables.end())
+            it->second = std::move(value);
+        else {
+            m_variables.emplace_back(name, std::move(value));
+            // Longest names first, so `$AB` isn't read as `$A` followed by B.
+            std::ranges::stable_sort(m_variables, std::greater{}, [](const auto& var) { return var.first.size(); });
+        }
+    }
+
+    std::string substitute(std::string value) const {
+        for (const auto& [name, replacement] : m_variables) {
+            const auto needle = "$" + name;
+            for (size_t pos = 0; (pos = value.find(needle, pos)) != std::string::npos; pos += replacement.size())
+                value.replace(pos, needle.size(), replacement);
+        }
+        return value;
+    }
+
+    std::unordered_set<std::string>                  m_visited;
+    std::unordered_map<std::string, size_t>          m_index;
+    std::vector<std::pair<std::string, std::string>> m_variables;
+    SInferredSchema                                  m_result;
+};
+
+static py::object inferredDefault(eValueType type) {
+    switch (type) {
+        case eValueType::INT: return py::int_(0);
+        case eValueType::FLOAT: return py::float_(0.0);
+        case eValueType::VEC2: return py::make_tuple(0.0, 0.0);
+        default: return py::str("");
+    }
+}
+
+static py::dict inferredToPython(const InferredKeys& keys) {
+    py::dict out;
+    for (const auto& [key, type] : keys)
+        out[py::str(key)] = inferredDefault(type);
+    return out;
+}
+
+static py::dict includeGraphToPython(const std::vector<std::pair<std::string, std::vector<std::string>>>& graph) {
+    py::dict out;
+    for (const auto& [file, sources] : graph)
+        out[py::str(file)] = py::cast(sources);
+    return out;
+}
+
+// A flat schema compiled once: typed defaults plus a shared snapshot layout.
+class CCompiledSchema {
+  public:
+    CCompiledSchema(py::object values, py::object defaults) {
+        std::vector<std::string> keys;
+        forEachDefault(values, defaults, [&](const std::string& name, const py::handle& defaultVal) {
+            keys.push_back(name);
+            m_defaults.push_back(toDefaultValue(defaultVal));
+        });
+        m_layout = SSnapshotLayout::build(std::move(keys));
+    }
+
+    const std::vector<std::string>& keys() const {
+        return m_layout->keys;
+    }
+
+    const std::vector<SDefaultValue>& defaults() const {
+        return m_defaults;
+    }
+
+    const std::shared_ptr<const SSnapshotLayout>& layout() const {
+        return m_layout;
+    }
+
+  private:
+    std::vector<SDefaultValue>             m_defaults;
+    std::shared_ptr<const SSnapshotLayout> m_layout;
+};
+
+enum class eHandlerKind {
+    LINE,    // Python callback per keyword line
+    BATCH,   // Python callback once per parse with every buffered line
+    COLLECT, // no callback, lines are kept until the next full parse()
+};
+
+struct SKeywordLine {
+    std::string              command;
+    std::string              value;
+    std::vector<std::string> args;
+};
+
+// A keyword registered through the bindings. BATCH handlers buffer lines in
+// pending during the parse; COLLECT handlers keep them in collected.
+struct SPyHandler {
+    std::string               name;
+    py::str                   pyName;
+    py::function              callback;
+    bool                      allowFlags = false;
+    eHandlerKind              kind       = eHandlerKind::LINE;
+    bool                      splitArgs  = false;
+    size_t                    maxArgs    = 0;
+    std::vector<SKeywordLine> pending;
+    std::vector<SKeywordLine> collected;
+};
+
+// The name a dynamic line assigns: the text before `=`, trimmed.
+static std::string dynamicKey(const std::string& line) {
+    const auto end   = line.find('=');
+    const auto name  = std::string_view(line).substr(0, end);
+    const auto begin = name.find_first_not_of(" \t");
+    if (begin == std::string_view::npos)
+        return {};
+    return std::string(name.substr(begin, name.find_last_not_of(" \t") - begin + 1));
+}
+
+// Splits "a, b ,c" into trimmed arguments. With maxArgs, the last argument
+// keeps the rest of the value, commas included.
+static std::vector<std::string> splitArgs(const std::string& value, size_t maxArgs) {
+    std::vector<std::string> args;
+    size_t                   start = 0;
+    while (true) {
+        size_t end = (maxArgs && args.size() + 1 == maxArgs) ? std::string::npos : value.find(',', start);
+        auto   arg = value.substr(start, end == std::string::npos ? std::string::npos : end - start);
+        size_t b   = arg.find_first_not_of(" \t");
+        size_t e   = arg.find_last_not_of(" \t");
+        args.push_back(b == std::string::npos ? std::string{} : arg.substr(b, e - b + 1));
+        if (end == std::string::npos)
+            break;
+        start = end + 1;
+    }
+    return args;
+}
+
+static py::tuple keywordLineToPython(const SKeywordLine& line, bool splitArgs) {
+    if (!splitArgs)
+        return py::make_tuple(py::str(line.command), py::str(line.value));
+    py::tuple args(line.args.size());
+    for (size_t i = 0; i < line.args.size(); ++i)
+        args[i] = py::str(line.args[i]);
+    return py::make_tuple(py::str(line.command), std::move(args));
+}
+
+static void setHandlerError(Hyprlang::CParseResult& result, const py::object& ret) {
+    if (ret.is_none() || !py::isinstance<py::str>(ret))
+        return;
+    std::string err = ret.cast<std::string>();
+    if (!err.empty()) {
+        result.error = true;
+        result.setError(err.c_str());
+    }
+}
+
+class CPyConfig;
+
+// hyprlang handlers are plain function pointers without user data, so the
+// Config that is parsing on the current thread is tracked here.
+static thread_local CPyConfig* g_pActiveConfig = nullptr;
+
+// CConfig plus the per-instance state the bindings need to keep around.
+class CPyConfig : public Hyprlang::CConfig {
+  public:
+    CPyConfig(const std::string& path, const Hyprlang::SConfigOptions& options) :
+        Hyprlang::CConfig(path.c_str(), options), m_rootPath(path), m_pathIsStream(options.pathIsStream) {}
+
+    // Held for every parse and by every binding that reads or changes the
+    // Config, so a parse running without the GIL (Config.aparse(), say)
+    // never overlaps another thread's access. Waits with the GIL released,
+    // since the parse needs it back to finish. Recursive, so handlers
+    // called during a parse can read the Config on the same thread.
+    std::unique_lock<std::recursive_mutex> lock() {
+        std::unique_lock guard(m_lock, std::try_to_lock);
+        if (!guard.owns_lock()) {
+            py::gil_scoped_release release;
+            guard.lock();
+        }
+        return guard;
+    }
+
+    void setRootPath(const std::string& path) {
+        changeRootPath(path.c_str());
+        m_rootPath = path;
+    }
+
+    // Runs a libhyprlang parse call with this Config marked active for the
+    // handler trampoline. The GIL is released unless a per-line Python
+    // handler is registered, in which case keeping it avoids re-acquiring
+    // it for every keyword line. Batch handlers are flushed afterwards.
+    // A full parse (reset=true) also drops lines kept by collectors. A
+    // dynamic parse passes the names its lines assign as dynamicKeys, so
+    // change tracking looks at those keys only.
+    template <typename F>
+    Hyprlang::CParseResult runParse(F&& parseFn, bool reset = false, const std::vector<std::string>* dynamicKeys = nullptr) {
+        auto guard = lock();
+        for (auto& [name, handler] : m_handlers) {
+            handler.pending.clear();
+            if (reset)
+                handler.collected.clear();
+        }
+
+        Hyprlang::CParseResult result = [&] {
+            CPyConfig* previous = g_pActiveConfig;
+            g_pActiveConfig     = this;
+            struct SRestore {
+                CPyConfig* previous;
+                ~SRestore() { g_pActiveConfig = previous; }
+            } restore{previous};
+
+            clearSpecialCache();
+            std::optional<py::gil_scoped_release> release;
+            if (m_lineHandlers == 0)
+                release.emplace();
+            return parseFn();
+        }();
+
+        flushBatchHandlers(result);
+        if (dynamicKeys)
+            trackChanges(*dynamicKeys);
+        else
+            trackChanges();
+        return result;
+    }
+
+    // Applies lines one after another under a single runParse. With rollback,
+    // a failed batch puts every registered value (and every keyed special
+    // value) back to what it was before, including its set-by-user flag.
+    std::vector<Hyprlang::CParseResult> parseDynamicMany(const std::vector<std::string>& lines, bool rollback) {
+        auto guard = lock();
+        std::vector<Hyprlang::CParseResult> results;
+        results.reserve(lines.size());
+        std::vector<SSavedValue> saved;
+        if (rollback)
+            saved = saveValues();
+
+        std::vector<std::string> keys;
+        keys.reserve(lines.size());
+        for (const auto& line : lines)
+            keys.push_back(dynamicKey(line));
+
+        bool failed = false;
+        auto flushed = runParse([&] {
+            for (const auto& line : lines) {
+                results.push_back(parseDynamic(line.c_str()));
+                failed = failed || results.back().error;
+            }
+            if (failed && rollback)
+                restoreValues(saved);
+            return Hyprlang::CParseResult{};
+        }, false, &keys);
+
+        // Batch handlers run once for the whole batch; report their error on
+        // the last line.
+        if (flushed.error && !results.empty() && !results.back().error)
+            results.back() = flushed;
+        return results;
+    }
+
+    void addHandler(const std::string& name, py::function callback, Hyprlang::SHandlerOptions opts, eHandlerKind kind, bool split = false,
+                    size_t maxArgs = 0) {
+        if (auto it = m_handlers.find(name); it != m_handlers.end()) {
+            if (it->second.kind == eHandlerKind::LINE)
+                m_lineHandlers--;
+            unregisterHandler(name.c_str());
+        }
+        m_handlers[name] = SPyHandler{name, py::str(name), std::move(callback), opts.allowFlags, kind, split, maxArgs, {}, {}};
+        if (kind == eHandlerKind::LINE)
+            m_lineHandlers++;
+        registerHandler(&CPyConfig::handlerTrampoline, ownString(name), opts);
+    }
+
+    void removeHandler(const std::string& name) {
+        if (auto it = m_handlers.find(name); it != m_handlers.end()) {
+            if (it->second.kind == eHandlerKind::LINE)
+                m_lineHandlers--;
+            m_handlers.erase(it);
+        }
+        unregisterHandler(name.c_str());
+    }
+
+    py::list getCollected(const std::string& name) {
+        auto guard = lock();
+        auto it = m_handlers.find(name);
+        if (it == m_handlers.end() || it->second.kind != eHandlerKind::COLLECT)
+            throw std::out_of_range("No collector registered for: " + name);
+        const auto& handler = it->second;
+        py::list    out(handler.collected.size());
+        for (size_t i = 0; i < handler.collected.size(); ++i)
+            out[i] = keywordLineToPython(handler.collected[i], handler.splitArgs);
+        return out;
+    }
+
+    // Converts a value to Python, reusing the object from the previous read
+    // when the raw value is unchanged. Special-category values live in a
+    // separate cache that is dropped on every parse, since parse() frees and
+    // reallocates their storage. Equal strings share one Python object.
+    py::object valueToPython(Hyprlang::CConfigValue* value, bool special = false) {
+        if (!value)
+            return py::none();
+
+        auto& cache         = special ? m_specialCache : m_valueCache;
+        auto [it, inserted] = cache.try_emplace(value);
+        auto& entry         = it->second;
+        if (inserted || entry.type == eValueType::NONE)
+            entry.type = valueTypeOf(value->getValue());
+        if (entry.type == eValueType::NONE || entry.type == eValueType::OTHER)
+            return anyToPython(value->getValue());
+
+        void* data = *value->getDataStaticPtr();
+        if (entry.object && entry.matches(data)) {
+            m_cacheHits++;
+            return entry.object;
+        }
+
+        m_cacheMisses++;
+        entry.remember(data);
+        entry.object = entry.type == eValueType::STRING ? internString(entry.strValue) : dataToPython(data, entry.type);
+        return entry.object;
+    }
+
+    // Copies every INT, FLOAT and VEC2 value of keys (all registered keys
+    // when empty) into typed buffers without building per-value objects.
+    NumericExport exportNumeric(const std::optional<std::vector<std::string>>& keys) {
+        auto guard = lock();
+        std::vector<int64_t> ints;
+        std::vector<float>   floats;
+        std::vector<float>   vec2s;
+        NumericExport        out;
+
+        auto add = [&](Hyprlang::CConfigValue* value, const py::handle& name) {
+            void* data = *value->getDataStaticPtr();
+            switch (typeOf(value)) {
+                case eValueType::INT:
+                    ints.push_back(*static_cast<int64_t*>(data));
+                    out.intKeys.append(name);
+                    break;
+                case eValueType::FLOAT:
+                    floats.push_back(*static_cast<float*>(data));
+                    out.floatKeys.append(name);
+                    break;
+                case eValueType::VEC2: {
+                    auto* v = static_cast<Hyprlang::SVector2D*>(data);
+                    vec2s.push_back(v->x);
+                    vec2s.push_back(v->y);
+                    out.vec2Keys.append(name);
+                    break;
+                }
+                default: break;
+            }
+        };
+
+        if (keys) {
+            for (const auto& key : *keys) {
+                auto* value = getConfigValuePtr(key.c_str());
+                if (!value)
+                    throw std::runtime_error("Config value not found: " + key);
+                add(value, py::str(key));
+            }
+        } else {
+            if (!m_layout || m_flatValues.size() != m_layout->keys.size())
+                buildSnapshot();
+            for (size_t i = 0; i < m_flatValues.size(); ++i) {
+                if (m_flatValues[i])
+                    add(m_flatValues[i], m_layout->names[i]);
+            }
+        }
+
+        out.ints   = py::cast(CNumericBuffer::make(std::move(ints)));
+        out.floats = py::cast(CNumericBuffer::make(std::move(floats)));
+        out.vec2s  = py::cast(CNumericBuffer::make(std::move(vec2s), 2));
+        return out;
+    }
+
+    void addSpecialField(const std::string& category, const std::string& name) {
+        auto& fields = m_specialFields[category];
+        if (std::find(fields.begin(), fields.end(), name) == fields.end())
+            fields.push_back(name);
+    }
+
+    void removeSpecialField(const std::string& category, const std::string& name) {
+        if (auto it = m_specialFields.find(category); it != m_specialFields.end())
+            std::erase(it->second, name);
+    }
+
+    void removeSpecialFields(const std::string& category) {
+        m_specialFields.erase(category);
+    }
+
+    // Reads every registered field of every key of a special category in one
+    // pass. Returns (keys, {field: column}); with buffers, numeric columns
+    // are NumericBuffers instead of lists.
+    py::tuple specialTable(const std::string& category, bool buffers) {
+        auto guard = lock();
+        auto       keys = listKeysForSpecialCategory(category.c_str());
+        py::dict   columns;
+        const auto it = m_specialFields.find(category);
+        if (it != m_specialFields.end()) {
+            for (const auto& field : it->second) {
+                std::vector<Hyprlang::CConfigValue*> values;
+                values.reserve(keys.size());
+                for (const auto& key : keys)
+                    values.push_back(getSpecialConfigValuePtr(category.c_str(), field.c_str(), key.c_str()));
+                columns[py::str(field)] = specialColumn(values, buffers);
+            }
+        }
+        return py::make_tuple(py::cast(keys), columns);
+    }
+
+    // Special values are freed by every parse and by removals, so cached
+    // objects and handle pointers to them must not outlive either.
+    void clearSpecialCache() {
+        m_parseEpoch++;
+        m_specialCache.clear();
+    }
+
+    py::dict cacheStats() {
+        auto guard = lock();
+        py::dict out;
+        out["hits"]        = m_cacheHits;
+        out["misses"]      = m_cacheMisses;
+        out["interned"]    = m_strings.size();
+        out["intern_hits"] = m_internHits;
+        return out;
+    }
+
+    // Bumped on every parse call and special removal. Special-category
+    // handles re-resolve when it changes, since both free keyed values.
+    uint64_t parseEpoch() const {
+        return m_parseEpoch;
+    }
+
+    // Owns a C string for as long as the Config lives. Names and keys handed
+    // to libhyprlang go through here, deduplicated, so repeated registration
+    // doesn't grow it.
+    const char* ownString(const std::string& value) {
+        return m_arena.insert(value).first->c_str();
+    }
+
+    void registerValue(const std::string& name, const Hyprlang::CConfigValue& value) {
+        addConfigValue(ownString(name), value);
+        addKey(name);
+    }
+
+    void registerSpecialCategory(const std::string& name, const SPySpecialCategoryOptions& opts) {
+        auto guard = lock();
+        Hyprlang::SSpecialCategoryOptions native = opts;
+        native.key                               = opts.ownedKey ? ownString(*opts.ownedKey) : nullptr;
+        addSpecialCategory(ownString(name), native);
+    }
+
+    void registerSpecialValue(const std::string& category, const std::string& name, const Hyprlang::CConfigValue& value) {
+        addSpecialConfigValue(ownString(category), ownString(name), value);
+        addSpecialField(category, name);
+    }
+
+    // Capture mode: registers every key the root source and the files it
+    // sources assign that isn't registered yet, typed as scanText infers it,
+    // and returns those keys. Files are read and scanned here without the
+    // GIL, so a schema-less parse needs no pre-pass in Python. Call it
+    // before commence().
+    InferredKeys captureSchema() {
+        InferredKeys captured;
+        {
+            py::gil_scoped_release release;
+            auto                   inferred = CSchemaInference::run(m_rootPath, m_pathIsStream);
+            captured                        = std::move(inferred.keys);
+            m_includeGraph                  = std::move(inferred.graph);
+        }
+
+        // libhyprlang only fills its value table in commence(), so membership
+        // is checked against the keys registered through the bindings.
+        const std::unordered_set<std::string_view> registered(m_keys.begin(), m_keys.end());
+        std::erase_if(captured, [&](const auto& entry) { return registered.contains(entry.first); });
+        for (const auto& [name, type] : captured) {
+            switch (type) {
+                case eValueType::INT: registerValue(name, Hyprlang::CConfigValue((Hyprlang::INT)0)); break;
+                case eValueType::FLOAT: registerValue(name, Hyprlang::CConfigValue((Hyprlang::FLOAT)0)); break;
+                case eValueType::VEC2: registerValue(name, Hyprlang::CConfigValue(Hyprlang::SVector2D{0, 0})); break;
+                default: registerValue(name, Hyprlang::CConfigValue((Hyprlang::STRING)"")); break;
+            }
+        }
+        return captured;
+    }
+
+    // The include graph found by the last captureSchema().
+    const std::vector<std::pair<std::string, std::vector<std::string>>>& includeGraph() const {
+        return m_includeGraph;
+    }
+
+    void addKey(const std::string& name) {
+        m_keys.push_back(name);
+        m_layout.reset();
+    }
+
+    // Registers every value of a compiled schema. When nothing else has been
+    // registered, the schema's snapshot layout is reused as is.
+    void addSchema(const CCompiledSchema& schema) {
+        auto guard = lock();
+        const auto& keys     = schema.keys();
+        const auto& defaults = schema.defaults();
+        bool        adopt    = m_keys.empty();
+        for (size_t i = 0; i < keys.size(); ++i) {
+            withConfigValue(defaults[i], [&](const Hyprlang::CConfigValue& value) { registerValue(keys[i], value); });
+        }
+        if (adopt)
+            m_layout = schema.layout();
+    }
+
+    // Resolves the value pointer of every registered key, building the
+    // layout first if no schema provided one.
+    void buildSnapshot() {
+        if (!m_layout)
+            m_layout = SSnapshotLayout::build(m_keys);
+        m_flatValues.clear();
+        m_keyStates.clear();
+        for (const auto& key : m_layout->keys) {
+            auto* value = getConfigValuePtr(key.c_str());
+            auto& state = m_keyStates.emplace_back();
+            m_flatValues.push_back(value);
+            if (value)
+                state.remember(value, typeOf(value), m_generation);
+        }
+        m_incremental[0] = m_incremental[1] = py::none();
+    }
+
+    // Bumps the generation and stamps every registered key whose value or
+    // set-by-user flag differs from what the last pass saw. The compare is
+    // on raw data, so no Python objects are built for unchanged keys.
+    void trackChanges() {
+        ensureSnapshot();
+        m_generation++;
+        for (size_t i = 0; i < m_flatValues.size(); ++i)
+            trackChange(i);
+    }
+
+    // Same, for the keys named by dynamic lines only. Handler keywords and
+    // `$VAR`s change no registered value. Any other name (`source`, say)
+    // may change anything, so it falls back to the full walk.
+    void trackChanges(const std::vector<std::string>& names) {
+        ensureSnapshot();
+        std::vector<size_t> indices;
+        for (const auto& name : names) {
+            auto [first, last] = m_layout->indices.equal_range(name);
+            if (first == last && !name.starts_with('$') && !findHandler(name.c_str()))
+                return trackChanges();
+            for (; first != last; ++first)
+                indices.push_back(first->second);
+        }
+        m_generation++;
+        for (size_t i : indices)
+            trackChange(i);
+    }
+
+    uint64_t generation() const {
+        return m_generation;
+    }
+
+    std::vector<std::string> changedSince(uint64_t generation) {
+        auto guard = lock();
+        ensureSnapshot();
+        std::vector<std::string> changed;
+        for (size_t i = 0; i < m_keyStates.size(); ++i) {
+            if (m_keyStates[i].generation > generation)
+                changed.push_back(m_layout->keys[i]);
+        }
+        return changed;
+    }
+
+    py::dict snapshot(bool flat, bool incremental = false) {
+        auto guard = lock();
+        ensureSnapshot();
+        if (incremental)
+            return incrementalSnapshot(flat);
+        if (flat) {
+            py::dict out;
+            for (size_t i = 0; i < m_flatValues.size(); ++i)
+                out[m_layout->names[i]] = valueToPython(m_flatValues[i]);
+            return out;
+        }
+        return fillSnapshot(m_layout->root);
+    }
+
+    std::shared_ptr<const SSnapshotLayout> snapshotLayout() {
+        auto guard = lock();
+        ensureSnapshot();
+        return m_layout;
+    }
+
+    // Value of key index in layout, which must still be the current one.
+    py::object layoutValue(const SSnapshotLayout* layout, size_t index) {
+        auto guard = lock();
+        ensureSnapshot();
+        if (layout != m_layout.get())
+            throw std::runtime_error("Config values were registered after this view was created");
+        return valueToPython(m_flatValues[index]);
+    }
+
+  private:
+    void trackChange(size_t i) {
+        auto* value = m_flatValues[i];
+        auto& state = m_keyStates[i];
+        if (value && !state.matches(value))
+            state.remember(value, state.raw.type, m_generation);
+    }
+
+    SPyHandler* findHandler(const char* command) {
+        if (auto it = m_handlers.find(command); it != m_handlers.end())
+            return &it->second;
+        // With allow_flags, hyprlang passes e.g. "bindm" to the "bind" handler.
+        SPyHandler* best = nullptr;
+        for (auto& [name, handler] : m_handlers) {
+            if (handler.allowFlags && std::strncmp(command, name.c_str(), name.size()) == 0 && (!best || name.size() > best->name.size()))
+                best = &handler;
+        }
+        return best;
+    }
+
+    static Hyprlang::CParseResult handlerTrampoline(const char* command, const char* value) {
+        Hyprlang::CParseResult result;
+        SPyHandler*            handler = g_pActiveConfig ? g_pActiveConfig->findHandler(command) : nullptr;
+        if (!handler) {
+            result.error = true;
+            result.setError((std::string("no handler registered for ") + command).c_str());
+            return result;
+        }
+
+        if (handler->kind != eHandlerKind::LINE) {
+            // Runs without the GIL: only C++ containers are touched here.
+            SKeywordLine line{command, value, {}};
+            if (handler->splitArgs)
+                line.args = splitArgs(line.value, handler->maxArgs);
+            (handler->kind == eHandlerKind::BATCH ? handler->pending : handler->collected).push_back(std::move(line));
+            return result;
+        }
+
+        // Per-line handlers run with the GIL still held (see runParse).
+        try {
+            py::object cmd = handler->name == command ? py::object(handler->pyName) : py::object(py::str(command));
+            setHandlerError(result, handler->callback(cmd, py::str(value)));
+        } catch (py::error_already_set& e) {
+            result.error = true;
+            result.setError(e.what());
+        }
+        return result;
+    }
+
+    void flushBatchHandlers(Hyprlang::CParseResult& result) {
+        for (auto& [name, handler] : m_handlers) {
+            if (handler.kind != eHandlerKind::BATCH || handler.pending.empty())
+                continue;
+            py::list lines(handler.pending.size());
+            for (size_t i = 0; i < handler.pending.size(); ++i)
+                lines[i] = keywordLineToPython(handler.pending[i], false);
+            handler.pending.clear();
+
+            Hyprlang::CParseResult batchResult;
+            try {
+                setHandlerError(batchResult, handler.callback(lines));
+            } catch (py::error_already_set& e) {
+                batchResult.error = true;
+                batchResult.setError(e.what());
+            }
+            if (batchResult.error && !result.error) {
+                result.error = true;
+                result.setError(batchResult.getError());
+            }
+        }
+    }
+
+    py::object specialColumn(const std::vector<Hyprlang::CConfigValue*>& values, bool buffers) {
+        eValueType type = eValueType::NONE;
+        for (auto* value : values) {
+            if (value) {
+                type = valueTypeOf(value->getValue());
+                break;
+            }
+        }
+
+        bool complete = std::find(values.begin(), values.end(), nullptr) == values.end();
+        if (buffers && complete) {
+            switch (type) {
+                case eValueType::INT: {
+                    std::vector<int64_t> column;
+                    for (auto* value : values)
+                        column.push_back(*static_cast<int64_t*>(*value->getDataStaticPtr()));
+                    return py::cast(CNumericBuffer::make(std::move(column)));
+                }
+                case eValueType::FLOAT: {
+                    std::vector<float> column;
+                    for (auto* value : values)
+                        column.push_back(*static_cast<float*>(*value->getDataStaticPtr()));
+                    return py::cast(CNumericBuffer::make(std::move(column)));
+                }
+                case eValueType::VEC2: {
+                    std::vector<float> column;
+                    for (auto* value : values) {
+                        auto* v = static_cast<Hyprlang::SVector2D*>(*value->getDataStaticPtr());
+                        column.push_back(v->x);
+                        column.push_back(v->y);
+                    }
+                    return py::cast(CNumericBuffer::make(std::move(column), 2));
+                }
+                default: break;
+            }
+        }
+
+        py::list column(values.size());
+        for (size_t i = 0; i < values.size(); ++i)
+            column[i] = valueToPython(values[i], true);
+        return column;
+    }
+
+    struct SSavedValue {
+        std::string category, field, key;
+        SRawValue   raw;
+        bool        setByUser = false;
+    };
+
+    Hyprlang::CConfigValue* savedValuePtr(const SSavedValue& saved) {
+        if (saved.category.empty())
+            return getConfigValuePtr(saved.field.c_str());
+        return getSpecialConfigValuePtr(saved.category.c_str(), saved.field.c_str(), saved.key.c_str());
+    }
+
+    std::vector<SSavedValue> saveValues() {
+        std::vector<SSavedValue> saved;
+        auto                     save = [&](SSavedValue entry) {
+            auto* value = savedValuePtr(entry);
+            if (!value)
+                return;
+            // Special values are reallocated by every parse(), so their type
+            // must not go through the pointer-keyed value cache.
+            entry.raw.type  = entry.category.empty() ? typeOf(value) : valueTypeOf(value->getValue());
+            entry.setByUser = value->m_bSetByUser;
+            entry.raw.remember(*value->getDataStaticPtr());
+            saved.push_back(std::move(entry));
+        };
+
+        for (const auto& name : m_keys)
+            save({{}, name, {}, {}, false});
+        for (const auto& [category, fields] : m_specialFields) {
+            for (const auto& key : listKeysForSpecialCategory(category.c_str())) {
+                for (const auto& field : fields)
+                    save({category, field, key, {}, false});
+            }
+        }
+        return saved;
+    }
+
+    // Writes saved values back into their storage. Nothing saved is parsed
+    // again, so `#` or `$` in a string can't change it.
+    void restoreValues(const std::vector<SSavedValue>& saved) {
+        for (const auto& entry : saved) {
+            auto* value = savedValuePtr(entry);
+            if (!value)
+                continue;
+            if (!entry.raw.matches(value->dataPtr()))
+                restoreValue(entry, value);
+            value->m_bSetByUser = entry.setByUser;
+        }
+        // Keyword lines of a rolled back batch are not delivered.
+        for (auto& [name, handler] : m_handlers)
+            handler.pending.clear();
+    }
+
+    void restoreValue(const SSavedValue& entry, Hyprlang::CConfigValue* value) {
+        const auto& raw = entry.raw;
+        switch (raw.type) {
+            case eValueType::INT: *static_cast<int64_t*>(value->dataPtr()) = raw.intValue; break;
+            case eValueType::FLOAT: *static_cast<float*>(value->dataPtr()) = raw.floatValue; break;
+            case eValueType::VEC2: *static_cast<Hyprlang::SVector2D*>(value->dataPtr()) = raw.vecValue; break;
+            case eValueType::STRING: {
+                // libhyprlang owns the buffer. When it is too short, have it
+                // allocate one by setting a placeholder of the same length,
+                // then copy the saved bytes over it.
+                if (std::strlen(static_cast<const char*>(value->dataPtr())) < raw.strValue.size()) {
+                    const auto name = entry.category.empty() ? entry.field : entry.category + "[" + entry.key + "]:" + entry.field;
+                    parseDynamic(name.c_str(), std::string(raw.strValue.size(), 'x').c_str());
+                }
+                std::memcpy(value->dataPtr(), raw.strValue.c_str(), raw.strValue.size() + 1);
+                break;
+            }
+            default: break;
+        }
+    }
+
+    eValueType typeOf(Hyprlang::CConfigValue* value) {
+        auto [it, inserted] = m_valueCache.try_emplace(value);
+        if (inserted)
+            it->second.type = valueTypeOf(value->getValue());
+        return it->second.type;
+    }
+
+    py::str internString(const std::string& value) {
+        if (auto it = m_strings.find(value); it != m_strings.end()) {
+            m_internHits++;
+            return it->second;
+        }
+        // Drop strings no cached value refers to any more before growing.
+        if (m_strings.size() >= 2 * (m_valueCache.size() + m_specialCache.size()) + 64)
+            std::erase_if(m_strings, [](const auto& kv) { return kv.second.ref_count() == 1; });
+        return m_strings.emplace(value, py::str(value)).first->second;
+    }
+
+    void ensureSnapshot() {
+        if (!m_layout || m_flatValues.size() != m_layout->keys.size())
+            buildSnapshot();
+    }
+
+    // One dict per shape, kept across calls and patched only where a key's
+    // generation moved past the one it was last refreshed at.
+    py::dict incrementalSnapshot(bool flat) {
+        auto& cached = m_incremental[flat];
+        auto& since  = m_incrementalGeneration[flat];
+        if (cached.is_none()) {
+            cached = snapshot(flat);
+            since  = m_generation;
+            return cached;
+        }
+
+        py::dict out = cached;
+        for (size_t i = 0; i < m_keyStates.size(); ++i) {
+            if (m_keyStates[i].generation <= since)
+                continue;
+            if (flat) {
+                out[m_layout->names[i]] = valueToPython(m_flatValues[i]);
+                continue;
+            }
+            const auto& path   = m_layout->paths[i];
+            py::dict    parent = out;
+            for (size_t depth = 0; depth + 1 < path.size(); ++depth)
+                parent = parent[path[depth]];
+            parent[path.back()] = valueToPython(m_flatValues[i]);
+        }
+        since = m_generation;
+        return out;
+    }
+
+    py::dict fillSnapshot(const SnapshotNode& node) {
+        py::dict out;
+        for (const auto& child : node.children) {
+            if (child.leaf)
+                out[child.name] = valueToPython(m_flatValues[child.index]);
+            else
+                out[child.name] = fillSnapshot(child);
+        }
+        return out;
+    }
+
+    std::string                                               m_rootPath;
+    bool                                                      m_pathIsStream = false;
+    std::vector<std::pair<std::string, std::vector<std::string>>> m_includeGraph;
+    std::vector<std::string>                                  m_keys;
+    std::shared_ptr<const SSnapshotLayout>                    m_layout;
+    struct SKeyState {
+        SRawValue raw;
+        bool      setByUser  = false;
+        uint64_t  generation = 0;
+
+        bool matches(Hyprlang::CConfigValue* value) const {
+            return setByUser == value->m_bSetByUser && raw.matches(*value->getDataStaticPtr());
+        }
+
+        void remember(Hyprlang::CConfigValue* value, eValueType type, uint64_t gen) {
+            raw.type   = type;
+            setByUser  = value->m_bSetByUser;
+            generation = gen;
+            raw.remember(*value->getDataStaticPtr());
+        }
+    };
+
+    std::vector<Hyprlang::CConfigValue*>                      m_flatValues;
+    std::vector<SKeyState>                                    m_keyStates;
+    uint64_t                                                  m_generation = 0;
+    py::object                                                m_incremental[2]           = {py::none(), py::none()};
+    uint64_t                                                  m_incrementalGeneration[2] = {0, 0};
+    std::unordered_map<std::string, SPyHandler>               m_handlers;
+    size_t                                                    m_lineHandlers = 0;
+    uint64_t                                                  m_parseEpoch   = 0;
+    std::unordered_map<Hyprlang::CConfigValue*, SCachedValue> m_valueCache;
+    std::unordered_map<Hyprlang::CConfigValue*, SCachedValue> m_specialCache;
+    std::unordered_map<std::string, py::str>                  m_strings;
+    std::unordered_map<std::string, std::vector<std::string>> m_specialFields;
+    std::unordered_set<std::string>                           m_arena;
+    std::recursive_mutex                                      m_lock;
+    uint64_t                                                  m_cacheHits   = 0;
+    uint64_t                                                  m_cacheMisses = 0;
+    uint64_t                                                  m_internHits  = 0;
+};
+
+// A bound, pointer-stable view of one config value. Regular values keep
+// their CConfigValue for the Config's lifetime, so reads skip the name
+// lookup entirely.
+class CValueHandle {
+  public:
+    CValueHandle(CPyConfig* config, std::string name) : m_config(config), m_name(std::move(name)) {
+        m_value = config->getConfigValuePtr(m_name.c_str());
+        if (!m_value)
+            throw std::runtime_error("Config value not found: " + m_name);
+    }
+
+    CValueHandle(CPyConfig* config, std::string category, std::string name, std::optional<std::string> key) :
+        m_config(config), m_name(std::move(name)), m_category(std::move(category)), m_key(std::move(key)), m_special(true) {
+        resolveSpecial();
+        if (!m_value)
+            throw std::runtime_error("Special config value not found: " + m_category + ":" + m_name);
+    }
+
+    py::object value() {
+        auto guard = m_config->lock();
+        if (m_special && m_epoch != m_config->parseEpoch())
+            resolveSpecial();
+        return m_config->valueToPython(m_value, m_special);
+    }
+
+    std::optional<bool> setByUser() {
+        auto guard = m_config->lock();
+        if (m_special && m_epoch != m_config->parseEpoch())
+            resolveSpecial();
+        if (!m_value)
+            return std::nullopt;
+        return m_value->m_bSetByUser;
+    }
+
+    const std::string& name() const {
+        return m_name;
+    }
+
+  private:
+    void resolveSpecial() {
+        m_value = m_config->getSpecialConfigValuePtr(m_category.c_str(), m_name.c_str(), m_key ? m_key->c_str() : nullptr);
+        m_epoch = m_config->parseEpoch();
+    }
+
+    CPyConfig*                 m_config = nullptr;
+    std::string                m_name;
+    std::string                m_category;
+    std::optional<std::string> m_key;
+    bool                       m_special = false;
+    Hyprlang::CConfigValue*    m_value   = nullptr;
+    uint64_t                   m_epoch   = 0;
+};
+
+// A read-only nested mapping over one level of a Config's snapshot layout.
+// Names come from the layout, so iteration and membership read no values.
+// Values are converted on access through the Config's value cache, so they
+// follow later parses; nested views are created on first access and kept.
+class CConfigView {
+  public:
+    CConfigView(py::object owner, std::shared_ptr<const SSnapshotLayout> layout, const SnapshotNode* node) :
+        m_owner(std::move(owner)), m_config(m_owner.cast<CPyConfig*>()), m_layout(std::move(layout)), m_node(node) {
+        // Later duplicates win, as they do in to_dict().
+        for (size_t i = 0; i < m_node->children.size(); ++i)
+            m_children[m_node->children[i].name] = py::int_(i);
+    }
+
+    py::object get(const py::handle& key) {
+        PyObject* found = PyDict_GetItemWithError(m_children.ptr(), key.ptr());
+        if (!found) {
+            if (!PyErr_Occurred())
+                PyErr_SetObject(PyExc_KeyError, key.ptr());
+            throw py::error_already_set();
+        }
+
+        const auto& child = m_node->children[py::handle(found).cast<size_t>()];
+        if (child.leaf)
+            return m_config->layoutValue(m_layout.get(), child.index);
+        if (PyObject* view = PyDict_GetItemWithError(m_views.ptr(), key.ptr()))
+            return py::reinterpret_borrow<py::object>(view);
+        if (PyErr_Occurred())
+            throw py::error_already_set();
+        auto view = py::cast(CConfigView(m_owner, m_layout, &child));
+        m_views[key] = view;
+        return view;
+    }
+
+    bool contains(const py::handle& key) const {
+        return m_children.contains(key);
+    }
+
+    size_t size() const {
+        return py::len(m_children);
+    }
+
+    py::iterator iter() const {
+        return py::iter(m_children);
+    }
+
+    bool equals(const py::handle& other) {
+        if (size() != py::len(other))
+            return false;
+        for (const auto& key : m_children) {
+            if (!other.contains(key.first) || !get(key.first).equal(other[key.first]))
+                return false;
+        }
+        return true;
+    }
+
+  private:
+    py::object                             m_owner; // the Python Config, kept alive
+    CPyConfig*                             m_config = nullptr;
+    std::shared_ptr<const SSnapshotLayout> m_layout;
+    const SnapshotNode*                    m_node = nullptr;
+    py::dict                               m_children; // name -> index into m_node->children
+    py::dict                               m_views;
+};
+
+#ifdef __linux__
+// Watches a set of files through inotify watches on their parent directories,
+// so saves that replace a file by renaming a temporary over it are seen too.
+class CFileWatcher {
+  public:
+    CFileWatcher() {
+        m_fd = inotify_init1(IN_NONBLOCK | IN_CLOEXEC);
+        if (m_fd < 0)
+            throwErrno(nullptr);
+    }
+
+    ~CFileWatcher() {
+        if (m_fd >= 0)
+            ::close(m_fd);
+    }
+
+    CFileWatcher(const CFileWatcher&)            = delete;
+    CFileWatcher& operator=(const CFileWatcher&) = delete;
+
+    int fileno() const {
+        return m_fd;
+    }
+
+    // Replaces the watched set. Directories that stay in use keep their
+    // watch, so events already queued for them are not lost.
+    void watch(const std::vector<std::string>& paths) {
+        std::unordered_set<std::string> files, dirs;
+        for (const auto& path : paths) {
+            auto file = std::filesystem::absolute(path).lexically_normal();
+            files.insert(file.string());
+            dirs.insert(file.parent_path().string());
+        }
+
+        for (auto it = m_dirs.begin(); it != m_dirs.end();) {
+            if (dirs.contains(it->second)) {
+                dirs.erase(it->second);
+                ++it;
+            } else {
+                inotify_rm_watch(m_fd, it->first);
+                it = m_dirs.erase(it);
+            }
+        }
+        for (const auto& dir : dirs) {
+            int wd = inotify_add_watch(m_fd, dir.c_str(), IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_CREATE | IN_DELETE);
+            if (wd >= 0)
+                m_dirs[wd] = dir;
+            else if (errno != ENOENT && errno != ENOTDIR)
+                throwErrno(dir.c_str());
+        }
+        m_files = std::move(files);
+    }
+
+    // Drains queued events without blocking and returns the watched files
+    // they touched, each once.
+    std::vector<std::string> read() {
+        std::vector<std::string> changed;
+        auto                     note = [&](const std::string& path) {
+            if (std::find(changed.begin(), changed.end(), path) == changed.end())
+                changed.push_back(path);
+        };
+
+        alignas(inotify_event) char buf[16384];
+        while (true) {
+            ssize_t n = ::read(m_fd, buf, sizeof(buf));
+            if (n < 0 && errno == EINTR)
+                continue;
+            if (n <= 0)
+                break;
+            for (char* p = buf; p < buf + n;) {
+                auto* event = reinterpret_cast<inotify_event*>(p);
+                p += sizeof(inotify_event) + event->len;
+                if (event->mask & IN_Q_OVERFLOW) {
+                    for (const auto& file : m_files)
+                        note(file);
+                    continue;
+                }
+                auto dir = m_dirs.find(event->wd);
+                if (dir == m_dirs.end() || event->len == 0)
+                    continue;
+                auto path = dir->second + "/" + event->name;
+                if (m_files.contains(path))
+                    note(path);
+            }
+        }
+        return changed;
+    }
+
+    // Blocks, without the GIL, until events are queued or timeout seconds
+    // pass (forever if negative).
+    bool wait(double timeout) {
+        pollfd pfd{m_fd, POLLIN, 0};
+        int    rc;
+        {
+            py::gil_scoped_release release;
+            rc = ::poll(&pfd, 1, timeout < 0 ? -1 : static_cast<int>(timeout * 1000));
+        }
+        if (rc < 0 && errno != EINTR)
+            throwErrno(nullptr);
+        return rc > 0;
+    }
+
+  private:
+    [[noreturn]] static void throwErrno(const char* path) {
+        if (path)
+            PyErr_SetFromErrnoWithFilename(PyExc_OSError, path);
+        else
+            PyErr_SetFromErrno(PyExc_OSError);
+        throw py::error_already_set();
+    }
+
+    int                                  m_fd = -1;
+    std::unordered_map<int, std::string> m_dirs;
+    std::unordered_set<std::string>      m_files;
+};
+#endif
+
 PYBIND11_MODULE(_core, m) {
     m.doc() = "Low-level Python bindings for hyprlang";
 
@@ -86,14 +1839,11 @@ PYBIND11_MODULE(_core, m) {
         .def(py::init<>())
         .def_readwrite("allow_flags", &Hyprlang::SHandlerOptions::allowFlags);
 
-    py::class_<Hyprlang::SSpecialCategoryOptions>(m, "SpecialCategoryOptions")
+    py::class_<SPySpecialCategoryOptions>(m, "SpecialCategoryOptions")
         .def(py::init<>())
-        .def_readwrite("ignore_missing", &Hyprlang::SSpecialCategoryOptions::ignoreMissing)
-        .def_readwrite("anonymous_key_based", &Hyprlang::SSpecialCategoryOptions::anonymousKeyBased)
-        .def("set_key", [](Hyprlang::SSpecialCategoryOptions& self, const std::string& key) {
-            auto* copy = new std::string(key);
-            self.key = copy->c_str();
-        }, py::arg("key"));
+        .def_readwrite("ignore_missing", &SPySpecialCategoryOptions::ignoreMissing)
+        .def_readwrite("anonymous_key_based", &SPySpecialCategoryOptions::anonymousKeyBased)
+        .def("set_key", [](SPySpecialCategoryOptions& self, const std::string& key) { self.ownedKey = key; }, py::arg("key"));
 
     py::class_<ConfigValueProxy>(m, "ConfigValueProxy")
         .def_readonly("value", &ConfigValueProxy::value)
@@ -102,10 +1852,116 @@ PYBIND11_MODULE(_core, m) {
             return "ConfigValueProxy(set_by_user=" + std::string(p.setByUser ? "True" : "False") + ")";
         });
 
-    py::class_<Hyprlang::CConfig>(m, "Config")
+    py::enum_<eValueType>(m, "ValueType")
+        .value("NONE", eValueType::NONE)
+        .value("INT", eValueType::INT)
+        .value("FLOAT", eValueType::FLOAT)
+        .value("STRING", eValueType::STRING)
+        .value("VEC2", eValueType::VEC2)
+        .value("OTHER", eValueType::OTHER);
+
+    m.def("infer_schema", [](const std::string& text) {
+        InferredKeys schema;
+        {
+            py::gil_scoped_release release;
+            schema = scanText(text).keys;
+        }
+        return inferredToPython(schema);
+    }, py::arg("text"));
+
+    m.def("source_files", [](const std::string& path, bool isStream) {
+        SInferredSchema inferred;
+        {
+            py::gil_scoped_release release;
+            inferred = CSchemaInference::run(path, isStream);
+        }
+        return inferred.files;
+    }, py::arg("path"), py::arg("is_stream") = false);
+
+    m.def("infer_file_schema", [](const std::string& path) {
+        SInferredSchema inferred;
+        {
+            py::gil_scoped_release release;
+            inferred = CSchemaInference::run(path, false);
+        }
+        return py::make_tuple(inferredToPython(inferred.keys), includeGraphToPython(inferred.graph));
+    }, py::arg("path"));
+
+    py::class_<CCompiledSchema, std::shared_ptr<CCompiledSchema>>(m, "CompiledSchema")
+        .def(py::init<py::object, py::object>(), py::arg("values"), py::arg("defaults") = py::none())
+        .def_property_readonly("keys", &CCompiledSchema::keys)
+        .def_property_readonly("types", [](const CCompiledSchema& self) {
+            std::vector<eValueType> types;
+            for (const auto& d : self.defaults())
+                types.push_back(d.type);
+            return types;
+        })
+        .def_property_readonly("defaults", [](const CCompiledSchema& self) {
+            py::list out;
+            for (const auto& d : self.defaults())
+                out.append(defaultToPython(d));
+            return out;
+        })
+        .def("__len__", [](const CCompiledSchema& self) {
+            return self.keys().size();
+        });
+
+    py::class_<CNumericBuffer>(m, "NumericBuffer", py::buffer_protocol())
+        .def_buffer(&CNumericBuffer::info)
+        .def("__len__", &CNumericBuffer::rows);
+
+    py::class_<NumericExport>(m, "NumericExport")
+        .def_readonly("ints", &NumericExport::ints)
+        .def_readonly("int_keys", &NumericExport::intKeys)
+        .def_readonly("floats", &NumericExport::floats)
+        .def_readonly("float_keys", &NumericExport::floatKeys)
+        .def_readonly("vec2s", &NumericExport::vec2s)
+        .def_readonly("vec2_keys", &NumericExport::vec2Keys);
+
+    py::class_<CValueHandle>(m, "ConfigValueHandle")
+        .def_property_readonly("value", &CValueHandle::value)
+        .def_property_readonly("set_by_user", &CValueHandle::setByUser)
+        .def_property_readonly("name", &CValueHandle::name)
+        .def("__repr__", [](const CValueHandle& h) {
+            return "ConfigValueHandle('" + h.name() + "')";
+        });
+
+    auto abc = py::module_::import("collections.abc");
+    py::class_<CConfigView> configView(m, "ConfigView");
+    configView
+        .def("__getitem__", &CConfigView::get, py::arg("key"))
+        .def("__contains__", &CConfigView::contains, py::arg("key"))
+        .def("__len__", &CConfigView::size)
+        .def("__iter__", &CConfigView::iter)
+        .def("get", [](CConfigView& self, const py::object& key, const py::object& defaultVal) {
+            return self.contains(key) ? self.get(key) : defaultVal;
+        }, py::arg("key"), py::arg("default") = py::none())
+        .def("keys", [abc](const py::object& self) { return abc.attr("KeysView")(self); })
+        .def("values", [abc](const py::object& self) { return abc.attr("ValuesView")(self); })
+        .def("items", [abc](const py::object& self) { return abc.attr("ItemsView")(self); })
+        .def("__eq__", [abc](CConfigView& self, const py::object& other) -> py::object {
+            if (!py::isinstance(other, abc.attr("Mapping")))
+                return py::reinterpret_borrow<py::object>(Py_NotImplemented);
+            return py::bool_(self.equals(other));
+        })
+        .def("__repr__", [](const CConfigView& self) {
+            return "ConfigView(" + py::repr(py::list(self.iter())).cast<std::string>() + ")";
+        });
+    abc.attr("Mapping").attr("register")(configView);
+
+#ifdef __linux__
+    py::class_<CFileWatcher>(m, "FileWatcher")
+        .def(py::init<>())
+        .def("fileno", &CFileWatcher::fileno)
+        .def("watch", &CFileWatcher::watch, py::arg("paths"))
+        .def("read", &CFileWatcher::read)
+        .def("wait", &CFileWatcher::wait, py::arg("timeout") = -1.0);
+#endif
+
+    py::class_<CPyConfig>(m, "Config")
         .def(py::init([](const std::string& path, const Hyprlang::SConfigOptions& opts) {
             try {
-                return new Hyprlang::CConfig(path.c_str(), opts);
+                return new CPyConfig(path, opts);
             } catch (const std::exception& e) {
                 throw std::runtime_error(std::string("Failed to create config: ") + e.what());
             } catch (...) {
@@ -113,129 +1969,185 @@ PYBIND11_MODULE(_core, m) {
             }
         }), py::arg("path"), py::arg("options") = Hyprlang::SConfigOptions{})
 
-        .def("add_value", [](Hyprlang::CConfig& self, const std::string& name, py::object defaultVal) {
-            if (py::isinstance<py::int_>(defaultVal)) {
-                self.addConfigValue(name.c_str(), Hyprlang::CConfigValue((Hyprlang::INT)defaultVal.cast<int64_t>()));
-            } else if (py::isinstance<py::float_>(defaultVal)) {
-                self.addConfigValue(name.c_str(), Hyprlang::CConfigValue((Hyprlang::FLOAT)defaultVal.cast<float>()));
-            } else if (py::isinstance<py::str>(defaultVal)) {
-                self.addConfigValue(name.c_str(), Hyprlang::CConfigValue((Hyprlang::STRING)defaultVal.cast<std::string>().c_str()));
-            } else if (py::isinstance<Hyprlang::SVector2D>(defaultVal)) {
-                self.addConfigValue(name.c_str(), Hyprlang::CConfigValue(defaultVal.cast<Hyprlang::SVector2D>()));
-            } else if (py::isinstance<py::tuple>(defaultVal) && py::len(defaultVal) == 2) {
-                auto t = defaultVal.cast<py::tuple>();
-                Hyprlang::SVector2D vec{t[0].cast<float>(), t[1].cast<float>()};
-                self.addConfigValue(name.c_str(), Hyprlang::CConfigValue(vec));
-            } else {
-                throw std::invalid_argument("Unsupported default value type. Use int, float, str, SVector2D, or tuple(float, float).");
-            }
+        .def("add_value", [](CPyConfig& self, const std::string& name, py::object defaultVal) {
+            auto guard = self.lock();
+            withConfigValue(defaultVal, [&](const Hyprlang::CConfigValue& value) { self.registerValue(name, value); });
         }, py::arg("name"), py::arg("default_value"))
 
-        .def("commence", &Hyprlang::CConfig::commence)
+        .def("add_values", [](CPyConfig& self, py::object values, py::object defaults) {
+            auto guard = self.lock();
+            forEachDefault(values, defaults, [&](const std::string& name, const py::handle& defaultVal) {
+                withConfigValue(defaultVal, [&](const Hyprlang::CConfigValue& value) { self.registerValue(name, value); });
+            });
+        }, py::arg("values"), py::arg("defaults") = py::none())
+
+        .def("add_schema", &CPyConfig::addSchema, py::arg("schema"))
+
+        .def("capture_schema", [](CPyConfig& self) {
+            auto guard = self.lock();
+            return inferredToPython(self.captureSchema());
+        })
+
+        .def_property_readonly("include_graph", [](CPyConfig& self) {
+            auto guard = self.lock();
+            return includeGraphToPython(self.includeGraph());
+        })
 
-        .def("parse", &Hyprlang::CConfig::parse)
+        .def("commence", [](CPyConfig& self) {
+            auto guard = self.lock();
+            self.commence();
+            self.buildSnapshot();
+        })
 
-        .def("parse_file", [](Hyprlang::CConfig& self, const std::string& path) {
-            return self.parseFile(path.c_str());
+        // Parsing is pure C++ work, so runParse releases the GIL for its
+        // duration and separate Config instances can parse in parallel.
+        // Arguments are converted before, and the ParseResult after, with the
+        // GIL held.
+        .def("parse", [](CPyConfig& self) {
+            return self.runParse([&] { return self.parse(); }, true);
+        })
+
+        .def("parse_file", [](CPyConfig& self, const std::string& path) {
+            return self.runParse([&] { return self.parseFile(path.c_str()); });
         }, py::arg("path"))
 
-        .def("parse_dynamic", [](Hyprlang::CConfig& self, const std::string& line) {
-            return self.parseDynamic(line.c_str());
+        .def("parse_dynamic", [](CPyConfig& self, const std::string& line) {
+            const std::vector<std::string> keys{dynamicKey(line)};
+            return self.runParse([&] { return self.parseDynamic(line.c_str()); }, false, &keys);
         }, py::arg("line"))
 
-        .def("parse_dynamic_kv", [](Hyprlang::CConfig& self, const std::string& command, const std::string& value) {
-            return self.parseDynamic(command.c_str(), value.c_str());
+        .def("parse_dynamic_many", &CPyConfig::parseDynamicMany, py::arg("lines"), py::arg("rollback") = false)
+
+        .def("parse_dynamic_kv", [](CPyConfig& self, const std::string& command, const std::string& value) {
+            const std::vector<std::string> keys{command};
+            return self.runParse([&] { return self.parseDynamic(command.c_str(), value.c_str()); }, false, &keys);
         }, py::arg("command"), py::arg("value"))
 
-        .def("get_value", [](Hyprlang::CConfig& self, const std::string& name) -> py::object {
-            auto val = self.getConfigValue(name.c_str());
-            return anyToPython(val);
+        .def("get_value", [](CPyConfig& self, const std::string& name) -> py::object {
+            auto guard = self.lock();
+            return self.valueToPython(self.getConfigValuePtr(name.c_str()));
         }, py::arg("name"))
 
-        .def("get_value_info", [](Hyprlang::CConfig& self, const std::string& name) -> ConfigValueProxy {
+        .def("get_values", [](CPyConfig& self, const std::vector<std::string>& names) -> py::dict {
+            auto guard = self.lock();
+            py::dict out;
+            for (const auto& name : names)
+                out[py::str(name)] = self.valueToPython(self.getConfigValuePtr(name.c_str()));
+            return out;
+        }, py::arg("names"))
+
+        .def("get_many", [](CPyConfig& self, const std::vector<std::string>& names, py::object defaults) -> py::list {
+            auto guard = self.lock();
+            if (!defaults.is_none() && py::len(defaults) != names.size())
+                throw std::invalid_argument("defaults must have the same length as names");
+            py::list out(names.size());
+            for (size_t i = 0; i < names.size(); ++i) {
+                py::object val = self.valueToPython(self.getConfigValuePtr(names[i].c_str()));
+                if (val.is_none() && !defaults.is_none())
+                    val = defaults[py::int_(i)];
+                out[i] = std::move(val);
+            }
+            return out;
+        }, py::arg("names"), py::arg("defaults") = py::none())
+
+        .def("snapshot", &CPyConfig::snapshot, py::arg("flat") = false, py::arg("incremental") = false)
+
+        .def_property_readonly("generation", &CPyConfig::generation)
+        .def("changed_since", &CPyConfig::changedSince, py::arg("generation"))
+
+        .def("export_numeric", &CPyConfig::exportNumeric, py::arg("keys") = py::none())
+
+        .def("get_value_info", [](CPyConfig& self, const std::string& name) -> ConfigValueProxy {
+            auto guard = self.lock();
             auto* ptr = self.getConfigValuePtr(name.c_str());
             if (!ptr)
                 throw std::runtime_error("Config value not found: " + name);
-            return ConfigValueProxy{anyToPython(ptr->getValue()), ptr->m_bSetByUser};
+            return ConfigValueProxy{self.valueToPython(ptr), ptr->m_bSetByUser};
         }, py::arg("name"))
 
-        .def("add_special_category", [](Hyprlang::CConfig& self, const std::string& name, Hyprlang::SSpecialCategoryOptions opts) {
-            self.addSpecialCategory(name.c_str(), opts);
-        }, py::arg("name"), py::arg("options") = Hyprlang::SSpecialCategoryOptions{})
+        .def("view", [](const py::object& self) {
+            auto layout = self.cast<CPyConfig&>().snapshotLayout();
+            const auto* root = &layout->root;
+            return CConfigView(self, std::move(layout), root);
+        })
+
+        .def("get_handle", [](CPyConfig& self, const std::string& name) {
+            auto guard = self.lock();
+            return CValueHandle(&self, name);
+        }, py::arg("name"), py::keep_alive<0, 1>())
+
+        .def("get_special_handle", [](CPyConfig& self, const std::string& cat, const std::string& name, std::optional<std::string> key) {
+            auto guard = self.lock();
+            return CValueHandle(&self, cat, name, std::move(key));
+        }, py::arg("category"), py::arg("name"), py::arg("key") = py::none(), py::keep_alive<0, 1>())
 
-        .def("remove_special_category", [](Hyprlang::CConfig& self, const std::string& name) {
+        .def("add_special_category", &CPyConfig::registerSpecialCategory, py::arg("name"), py::arg("options") = SPySpecialCategoryOptions{})
+
+        .def("remove_special_category", [](CPyConfig& self, const std::string& name) {
+            auto guard = self.lock();
+            self.clearSpecialCache();
+            self.removeSpecialFields(name);
             self.removeSpecialCategory(name.c_str());
         }, py::arg("name"))
 
-        .def("add_special_value", [](Hyprlang::CConfig& self, const std::string& cat, const std::string& name, py::object defaultVal) {
-            if (py::isinstance<py::int_>(defaultVal)) {
-                self.addSpecialConfigValue(cat.c_str(), name.c_str(), Hyprlang::CConfigValue((Hyprlang::INT)defaultVal.cast<int64_t>()));
-            } else if (py::isinstance<py::float_>(defaultVal)) {
-                self.addSpecialConfigValue(cat.c_str(), name.c_str(), Hyprlang::CConfigValue((Hyprlang::FLOAT)defaultVal.cast<float>()));
-            } else if (py::isinstance<py::str>(defaultVal)) {
-                self.addSpecialConfigValue(cat.c_str(), name.c_str(), Hyprlang::CConfigValue((Hyprlang::STRING)defaultVal.cast<std::string>().c_str()));
-            } else if (py::isinstance<Hyprlang::SVector2D>(defaultVal)) {
-                self.addSpecialConfigValue(cat.c_str(), name.c_str(), Hyprlang::CConfigValue(defaultVal.cast<Hyprlang::SVector2D>()));
-            } else if (py::isinstance<py::tuple>(defaultVal) && py::len(defaultVal) == 2) {
-                auto t = defaultVal.cast<py::tuple>();
-                Hyprlang::SVector2D vec{t[0].cast<float>(), t[1].cast<float>()};
-                self.addSpecialConfigValue(cat.c_str(), name.c_str(), Hyprlang::CConfigValue(vec));
-            } else {
-                throw std::invalid_argument("Unsupported default value type.");
-            }
+        .def("add_special_value", [](CPyConfig& self, const std::string& cat, const std::string& name, py::object defaultVal) {
+            auto guard = self.lock();
+            withConfigValue(defaultVal, [&](const Hyprlang::CConfigValue& value) { self.registerSpecialValue(cat, name, value); });
         }, py::arg("category"), py::arg("name"), py::arg("default_value"))
 
-        .def("remove_special_value", [](Hyprlang::CConfig& self, const std::string& cat, const std::string& name) {
+        .def("add_special_values", [](CPyConfig& self, const std::string& cat, py::object values, py::object defaults) {
+            auto guard = self.lock();
+            forEachDefault(values, defaults, [&](const std::string& name, const py::handle& defaultVal) {
+                withConfigValue(defaultVal, [&](const Hyprlang::CConfigValue& value) { self.registerSpecialValue(cat, name, value); });
+            });
+        }, py::arg("category"), py::arg("values"), py::arg("defaults") = py::none())
+
+        .def("remove_special_value", [](CPyConfig& self, const std::string& cat, const std::string& name) {
+            auto guard = self.lock();
+            self.clearSpecialCache();
+            self.removeSpecialField(cat, name);
             self.removeSpecialConfigValue(cat.c_str(), name.c_str());
         }, py::arg("category"), py::arg("name"))
 
-        .def("get_special_value", [](Hyprlang::CConfig& self, const std::string& cat, const std::string& name, py::object key) -> py::object {
-            const char* keyPtr = key.is_none() ? nullptr : key.cast<std::string>().c_str();
-            auto val = self.getSpecialConfigValue(cat.c_str(), name.c_str(), keyPtr);
-            return anyToPython(val);
+        .def("get_special_value", [](CPyConfig& self, const std::string& cat, const std::string& name, std::optional<std::string> key) -> py::object {
+            auto guard = self.lock();
+            auto* ptr = self.getSpecialConfigValuePtr(cat.c_str(), name.c_str(), key ? key->c_str() : nullptr);
+            return self.valueToPython(ptr, true);
         }, py::arg("category"), py::arg("name"), py::arg("key") = py::none())
 
-        .def("special_category_exists", [](Hyprlang::CConfig& self, const std::string& cat, const std::string& key) {
+        .def("get_special_table", &CPyConfig::specialTable, py::arg("category"), py::arg("buffers") = false)
+
+        .def("cache_stats", &CPyConfig::cacheStats)
+
+        .def("special_category_exists", [](CPyConfig& self, const std::string& cat, const std::string& key) {
+            auto guard = self.lock();
             return self.specialCategoryExistsForKey(cat.c_str(), key.c_str());
         }, py::arg("category"), py::arg("key"))
 
-        .def("list_keys_for_special_category", [](Hyprlang::CConfig& self, const std::string& cat) {
+        .def("list_keys_for_special_category", [](CPyConfig& self, const std::string& cat) {
+            auto guard = self.lock();
             return self.listKeysForSpecialCategory(cat.c_str());
         }, py::arg("category"))
 
-        .def("register_handler", [](Hyprlang::CConfig& self, const std::string& name, py::function callback, Hyprlang::SHandlerOptions opts) {
-            auto cb = std::make_shared<py::function>(callback);
-
-            auto trampoline = [cb](const char* command, const char* value) -> Hyprlang::CParseResult {
-                Hyprlang::CParseResult result;
-                py::gil_scoped_acquire gil;
-                try {
-                    py::object ret = (*cb)(py::str(command), py::str(value));
-                    if (!ret.is_none() && py::isinstance<py::str>(ret)) {
-                        std::string err = ret.cast<std::string>();
-                        if (!err.empty()) {
-                            result.error = true;
-                            result.setError(err.c_str());
-                        }
-                    }
-                } catch (py::error_already_set& e) {
-                    result.error = true;
-                    result.setError(e.what());
-                }
-                return result;
-            };
+        .def("register_handler", [](CPyConfig& self, const std::string& name, py::function callback, Hyprlang::SHandlerOptions opts, bool batch) {
+            auto guard = self.lock();
+            self.addHandler(name, std::move(callback), opts, batch ? eHandlerKind::BATCH : eHandlerKind::LINE);
+        }, py::arg("name"), py::arg("callback"), py::arg("options") = Hyprlang::SHandlerOptions{}, py::arg("batch") = false)
+
+        .def("add_collector", [](CPyConfig& self, const std::string& name, bool splitArgs, size_t maxArgs, Hyprlang::SHandlerOptions opts) {
+            auto guard = self.lock();
+            self.addHandler(name, py::function(), opts, eHandlerKind::COLLECT, splitArgs, maxArgs);
+        }, py::arg("name"), py::arg("split_args") = false, py::arg("max_args") = 0, py::arg("options") = Hyprlang::SHandlerOptions{})
 
-            throw std::runtime_error(
-                "register_handler with Python callables is not yet supported. "
-                "Use the high-level API's on_keyword() or parse with handlers dict instead."
-            );
-        }, py::arg("name"), py::arg("callback"), py::arg("options") = Hyprlang::SHandlerOptions{})
+        .def("get_collected", &CPyConfig::getCollected, py::arg("name"))
 
-        .def("unregister_handler", [](Hyprlang::CConfig& self, const std::string& name) {
-            self.unregisterHandler(name.c_str());
+        .def("unregister_handler", [](CPyConfig& self, const std::string& name) {
+            auto guard = self.lock();
+            self.removeHandler(name);
         }, py::arg("name"))
 
-        .def("change_root_path", [](Hyprlang::CConfig& self, const std::string& path) {
-            self.changeRootPath(path.c_str());
+        .def("change_root_path", [](CPyConfig& self, const std::string& path) {
+            auto guard = self.lock();
+            self.setRootPath(path);
         }, py::arg("path"));
 }
@@ -27,90 +27,77 @@ High-level (Pythonic):
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import itertools
+import marshal
+import os
+import queue
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import NamedTuple
+
 from hyprlang_pybind._core import (
+    CompiledSchema as _CompiledSchema,
     Config as _Config,
     ConfigOptions,
+    ConfigValueHandle,
+    ConfigView,
     ConfigValueProxy,
     HandlerOptions,
+    NumericBuffer,
+    NumericExport,
     ParseResult,
     SpecialCategoryOptions,
     SVector2D,
+    ValueType,
+    infer_file_schema as _core_infer_file_schema,
+    source_files as _core_source_files,
 )
 
+try:
+    from hyprlang_pybind._core import FileWatcher as _FileWatcher
+except ImportError:  # built without inotify support
+    _FileWatcher = None
+
 __all__ = [
     "ConfigOptions",
+    "ConfigValueHandle",
+    "ConfigView",
     "ConfigValueProxy",
     "HandlerOptions",
+    "NumericBuffer",
+    "NumericExport",
     "ParseResult",
     "SpecialCategoryOptions",
     "SVector2D",
+    "ValueType",
     "Config",
+    "Schema",
+    "ConfigPool",
+    "ParseCache",
+    "ConfigSnapshot",
+    "ConfigWatcher",
     "parse_file",
     "parse_string",
+    "infer_file_schema",
+    "aparse_file",
+    "aparse_string",
+    "parse_many",
+    "iter_parse",
+    "ParseOutcome",
     "HyprlangError",
 ]
 
 type ConfigValue = int | float | str | tuple[float, float]
 
-_BOOL_WORDS = frozenset({"true", "false", "yes", "no", "on", "off"})
-_RE_INT = __import__("re").compile(r"^-?\d+$")
-_RE_HEX = __import__("re").compile(r"^0x[0-9a-fA-F]+$")
-_RE_FLOAT = __import__("re").compile(r"^-?\d*\.\d+$|^-?\d+\.\d*$")
-_RE_VEC2 = __import__("re").compile(r"^-?\d+\.?\d*\s+-?\d+\.?\d*$")
-_RE_COLOR = __import__("re").compile(r"^rgba?\(")
-
-
-def _infer_type(value: str) -> ConfigValue:
-    """Infer a hyprlang default from a raw value string."""
-    v = value.strip()
-    if v.lower() in _BOOL_WORDS:
-        return 0
-    if _RE_HEX.match(v) or _RE_INT.match(v):
-        return 0
-    if _RE_COLOR.match(v):
-        return 0
-    if _RE_FLOAT.match(v):
-        return 0.0
-    if _RE_VEC2.match(v):
-        return (0.0, 0.0)
-    return ""
-
-
-def _infer_schema(text: str) -> dict[str, ConfigValue]:
-    """Pre-scan hyprlang text and build a flat schema by inferring types."""
-    schema: dict[str, ConfigValue] = {}
-    category_stack: list[str] = []
-
-    for raw_line in text.splitlines():
-        line = raw_line.split("#")[0].strip()
-        if not line:
-            continue
-
-        if line.startswith("$") or line.startswith("source"):
-            continue
-
-        if line.endswith("{"):
-            cat = line[:-1].strip().split("[")[0].strip()
-            if cat:
-                category_stack.append(cat)
-            continue
-
-        if line == "}":
-            if category_stack:
-                category_stack.pop()
-            continue
-
-        if "=" in line:
-            key, _, val = line.partition("=")
-            key = key.strip()
-            val = val.strip()
-            if not key or not val:
-                continue
-            full_key = ":".join([*category_stack, key])
-            schema[full_key] = _infer_type(val)
-
-    return schema
-
 
 class HyprlangError(Exception):
     """Raised when hyprlang parsing fails."""
@@ -130,18 +117,62 @@ def _flatten_schema(
     return result
 
 
-def _unflatten(flat: dict[str, object]) -> dict[str, object]:
-    """Convert colon-separated flat keys back into a nested dict."""
-    result: dict[str, object] = {}
-    for key, value in flat.items():
-        parts = key.split(":")
-        current = result
-        for part in parts[:-1]:
-            if part not in current:
-                current[part] = {}
-            current = current[part]  # type: ignore[assignment]
-        current[parts[-1]] = value
-    return result
+class Schema:
+    """A schema compiled once into a flat, typed table.
+
+    Takes the same nested dict as parse_file()/parse_string(). Passing a
+    Schema instead of the dict skips flattening, default type checks and
+    building the snapshot layout on every parse.
+    """
+
+    __slots__ = ("_compiled", "_fingerprint")
+
+    def __init__(self, schema: dict) -> None:
+        self._compiled = _CompiledSchema(_flatten_schema(schema))
+        digest = hashlib.blake2b(digest_size=16)
+        for key, value_type, default in zip(
+            self._compiled.keys, self._compiled.types, self._compiled.defaults
+        ):
+            entry = f"{key}\x1f{value_type.name}\x1f{default!r}\x1e"
+            digest.update(entry.encode())
+        self._fingerprint = digest.hexdigest()
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        """Flat colon-separated keys, in registration order."""
+        return tuple(self._compiled.keys)
+
+    @property
+    def types(self) -> dict[str, ValueType]:
+        """The hyprlang value type of each key."""
+        return dict(zip(self._compiled.keys, self._compiled.types))
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable hex digest of keys, types and defaults."""
+        return self._fingerprint
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Schema):
+            return NotImplemented
+        return self._fingerprint == other._fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self._fingerprint)
+
+    def __repr__(self) -> str:
+        return f"Schema({len(self)} keys, fingerprint={self._fingerprint!r})"
+
+    def __reduce__(self) -> tuple[type[Schema], tuple[dict[str, ConfigValue]]]:
+        # The compiled table can't be pickled; rebuild it from flat defaults.
+        return (Schema, (dict(zip(self._compiled.keys, self._compiled.defaults)),))
+
+
+def _as_schema(schema: Schema | dict) -> Schema:
+    return schema if isinstance(schema, Schema) else Schema(schema)
 
 
 class Config:
@@ -155,6 +186,7 @@ class Config:
         throw_all_errors: bool = False,
         allow_missing_config: bool = False,
         is_stream: bool = False,
+        schema: Schema | dict | None = None,
     ) -> None:
         opts = ConfigOptions()
         opts.verify_only = int(verify_only)
@@ -162,8 +194,9 @@ class Config:
         opts.allow_missing_config = int(allow_missing_config)
         opts.path_is_stream = int(is_stream)
         self._config = _Config(path, opts)
-        self._keys: list[str] = []
         self._commenced = False
+        if schema is not None:
+            self.add_schema(schema)
 
     def add(
         self,
@@ -174,7 +207,38 @@ class Config:
         if self._commenced:
             raise HyprlangError("Cannot add values after commence()")
         self._config.add_value(name, default)
-        self._keys.append(name)
+
+    def add_many(
+        self, values: Iterable[tuple[str, ConfigValue | SVector2D]]
+    ) -> None:
+        """Register several (name, default) pairs. Must be called before commence()."""
+        if self._commenced:
+            raise HyprlangError("Cannot add values after commence()")
+        self._config.add_values(list(values))
+
+    def add_schema(self, schema: Schema | dict) -> None:
+        """Register every value of a schema. Must be called before commence()."""
+        if self._commenced:
+            raise HyprlangError("Cannot add values after commence()")
+        schema = _as_schema(schema)
+        self._config.add_schema(schema._compiled)
+
+    def capture(self) -> dict[str, ConfigValue]:
+        """Register every key the source assigns that isn't registered yet.
+
+        Files it sources are followed, as in infer_file_schema(). Types are
+        inferred as for parse_file() without a schema, natively and without
+        reading anything in Python. Returns the captured keys with their
+        defaults. Must be called before commence().
+        """
+        if self._commenced:
+            raise HyprlangError("Cannot add values after commence()")
+        return self._config.capture_schema()
+
+    @property
+    def include_graph(self) -> dict[str, list[str]]:
+        """The files read by the last capture(), each with the files it sources."""
+        return self._config.include_graph
 
     def add_special_category(
         self,
@@ -201,6 +265,57 @@ class Config:
         """Register a config value within a special category."""
         self._config.add_special_value(category, name, default)
 
+    def add_special_many(
+        self,
+        category: str,
+        values: Iterable[tuple[str, ConfigValue | SVector2D]],
+    ) -> None:
+        """Register several (name, default) pairs within a special category."""
+        self._config.add_special_values(category, values)
+
+    def on_keyword(
+        self,
+        name: str,
+        callback: Callable[..., str | None],
+        *,
+        allow_flags: bool = False,
+        batch: bool = False,
+    ) -> None:
+        """Register a handler for a keyword such as ``bind`` or ``exec``.
+
+        The callback receives ``(command, value)`` for every matching line, or,
+        with batch=True, a single list of ``(command, value)`` tuples after each
+        parse. Returning a non-empty string reports it as a parse error.
+        """
+        opts = HandlerOptions()
+        opts.allow_flags = allow_flags
+        self._config.register_handler(name, callback, opts, batch)
+
+    def add_collector(
+        self,
+        name: str,
+        *,
+        split: bool = False,
+        max_args: int = 0,
+        allow_flags: bool = False,
+    ) -> None:
+        """Collect every line of a repeated keyword (``bind``, ``windowrule``, ...).
+
+        No Python code runs during the parse; read the lines afterwards with
+        get_collected(). With split=True, values are split on commas.
+        """
+        opts = HandlerOptions()
+        opts.allow_flags = allow_flags
+        self._config.add_collector(name, split, max_args, opts)
+
+    def get_collected(self, name: str) -> list[tuple]:
+        """Return the lines collected for a keyword since the last parse()."""
+        return self._config.get_collected(name)
+
+    def remove_keyword(self, name: str) -> None:
+        """Unregister a keyword handler or collector."""
+        self._config.unregister_handler(name)
+
     def commence(self) -> None:
         """Lock the schema. No new values can be added after this."""
         self._config.commence()
@@ -218,6 +333,29 @@ class Config:
         if result.error:
             raise HyprlangError(result.error_message)
 
+    async def aparse(self) -> None:
+        """Like parse(), but runs off the event loop in a worker thread.
+
+        Reads of this Config from other threads, the loop's included, wait
+        until the parse is done.
+        """
+        await asyncio.to_thread(self.parse)
+
+    async def aparse_dynamic(self, line: str) -> None:
+        """Like parse_dynamic(), but runs off the event loop in a worker thread."""
+        await asyncio.to_thread(self.parse_dynamic, line)
+
+    def parse_dynamic_many(
+        self, lines: Iterable[str], *, rollback: bool = False
+    ) -> list[ParseResult]:
+        """Parse many dynamic lines in one native call.
+
+        Returns one ParseResult per line instead of raising. With
+        rollback=True, any failure restores every value to its state
+        before the batch.
+        """
+        return self._config.parse_dynamic_many(list(lines), rollback)
+
     def parse_file(self, path: str) -> None:
         """Parse an additional config file. Raises HyprlangError on failure."""
         result = self._config.parse_file(path)
@@ -231,12 +369,34 @@ class Config:
             return default
         return val
 
+    def get_many(
+        self, names: list[str], defaults: list[object] | None = None
+    ) -> list[ConfigValue | None]:
+        """Get several config values in one call, in the order of names.
+
+        Missing values are replaced by the matching entry of defaults, or None.
+        """
+        return self._config.get_many(names, defaults)
+
     def get_special(
         self, category: str, name: str, key: str | None = None
     ) -> ConfigValue | None:
         """Get a special category config value."""
         return self._config.get_special_value(category, name, key)
 
+    def get_handle(self, name: str) -> ConfigValueHandle:
+        """Return a handle whose ``.value`` reads the value without a name lookup.
+
+        Handles stay valid across parse() calls. Use them after commence().
+        """
+        return self._config.get_handle(name)
+
+    def get_special_handle(
+        self, category: str, name: str, key: str | None = None
+    ) -> ConfigValueHandle:
+        """Return a handle for a special category value."""
+        return self._config.get_special_handle(category, name, key)
+
     def is_set_by_user(self, name: str) -> bool:
         """Check if a config value was explicitly set by the user."""
         info = self._config.get_value_info(name)
@@ -250,12 +410,55 @@ class Config:
         """List all keys for a special category."""
         return self._config.list_keys_for_special_category(category)
 
-    def to_dict(self) -> dict[str, object]:
-        """Return all registered config values as a nested dict."""
-        flat = {}
-        for key in self._keys:
-            flat[key] = self._config.get_value(key)
-        return _unflatten(flat)
+    def get_special_table(
+        self, category: str, *, buffers: bool = False
+    ) -> tuple[list[str], dict[str, list | NumericBuffer]]:
+        """Read a whole special category as columns in one call.
+
+        Returns (keys, {field: column}) where column[i] belongs to keys[i].
+        With buffers=True, int/float/vec2 columns are NumericBuffers.
+        """
+        return self._config.get_special_table(category, buffers)
+
+    def export_numeric(self, keys: list[str] | None = None) -> NumericExport:
+        """Copy int, float and vec2 values into typed buffers.
+
+        Covers all registered keys, or only keys. See NumericExport.
+        """
+        return self._config.export_numeric(keys)
+
+    def cache_stats(self) -> dict[str, int]:
+        """Hit/miss counters of the converted-value cache and string interning."""
+        return self._config.cache_stats()
+
+    def to_dict(
+        self, *, flat: bool = False, incremental: bool = False
+    ) -> dict[str, object]:
+        """Return all registered config values as a nested dict.
+
+        With flat=True, keys stay colon-separated (e.g. "general:gaps_in").
+        With incremental=True, the same dict is returned on every call and
+        only keys that changed since the previous call are refreshed.
+        """
+        return self._config.snapshot(flat, incremental)
+
+    @property
+    def generation(self) -> int:
+        """Counter advanced by every parse call; see changed_since()."""
+        return self._config.generation
+
+    def changed_since(self, generation: int) -> list[str]:
+        """Registered keys whose value or set-by-user flag changed after generation."""
+        return self._config.changed_since(generation)
+
+    def view(self) -> ConfigView:
+        """Return a read-only nested Mapping that converts values on access.
+
+        Keys come from the registered names without reading any value, and
+        category sub-views are created once, on first access. Values follow
+        later parses. Cheaper than to_dict() when only a few keys are read.
+        """
+        return self._config.view()
 
     def __getitem__(self, name: str) -> ConfigValue:
         val = self._config.get_value(name)
@@ -272,61 +475,868 @@ class Config:
         return self._config
 
 
+class ConfigPool:
+    """A bounded, thread-safe pool of commenced parsers for one schema.
+
+    Parsers are created on demand, up to size, and reused: checking one out
+    swaps in the new text or root path, and parse() resets every value to its
+    default before parsing. When all parsers are in use, checkout blocks.
+    """
+
+    def __init__(
+        self,
+        schema: Schema | dict,
+        *,
+        size: int = 8,
+        verify_only: bool = False,
+        throw_all_errors: bool = False,
+        allow_missing_config: bool = False,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._schema = _as_schema(schema)
+        self._size = size
+        self._options = {
+            "verify_only": verify_only,
+            "throw_all_errors": throw_all_errors,
+            "allow_missing_config": allow_missing_config,
+        }
+        self._idle: dict[bool, list[Config]] = {True: [], False: []}
+        self._created = 0
+        self._cond = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """Maximum number of parsers the pool creates."""
+        return self._size
+
+    @contextmanager
+    def checkout(
+        self,
+        source: str,
+        *,
+        is_stream: bool = False,
+        timeout: float | None = None,
+    ) -> Iterator[Config]:
+        """Borrow a commenced Config for source (a path, or text if is_stream).
+
+        Call parse() on it inside the block. Raises TimeoutError if no parser
+        frees up within timeout seconds.
+        """
+        config = self._acquire(source, is_stream, timeout)
+        try:
+            yield config
+        finally:
+            with self._cond:
+                self._idle[is_stream].append(config)
+                self._cond.notify()
+
+    def parse_string(
+        self, text: str, *, timeout: float | None = None
+    ) -> dict[str, object]:
+        """Parse a config string with a pooled parser and return a nested dict."""
+        with self.checkout(text, is_stream=True, timeout=timeout) as config:
+            config.parse()
+            return config.to_dict()
+
+    def parse_file(
+        self, path: str, *, timeout: float | None = None
+    ) -> dict[str, object]:
+        """Parse a config file with a pooled parser and return a nested dict."""
+        with self.checkout(path, timeout=timeout) as config:
+            config.parse()
+            return config.to_dict()
+
+    def _acquire(
+        self, source: str, is_stream: bool, timeout: float | None
+    ) -> Config:
+        with self._cond:
+            while True:
+                if self._idle[is_stream]:
+                    config = self._idle[is_stream].pop()
+                    break
+                if self._created < self._size or self._idle[not is_stream]:
+                    # Make room by dropping an idle parser of the other mode.
+                    if self._created >= self._size:
+                        self._idle[not is_stream].pop()
+                        self._created -= 1
+                    self._created += 1
+                    config = None
+                    break
+                if not self._cond.wait(timeout):
+                    raise TimeoutError("no parser available in ConfigPool")
+
+        if config is not None:
+            # In stream mode hyprlang keeps the text in the root path slot.
+            config.raw.change_root_path(source)
+            return config
+
+        try:
+            config = Config(
+                source, is_stream=is_stream, schema=self._schema, **self._options
+            )
+            config.commence()
+        except BaseException:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+        return config
+
+
+def _read_sources(path: str, *, is_stream: bool = False) -> dict[str, bytes | None]:
+    """The contents of the root file and every file it sources, transitively.
+
+    Sources are resolved natively, exactly as schema inference follows them
+    (see infer_file_schema()). Missing files map to None, so their creation
+    can be noticed. In stream mode, path is the text itself and is left out.
+    """
+    files: dict[str, bytes | None] = {}
+    for source in _core_source_files(os.fspath(path), is_stream):
+        try:
+            with open(source, "rb") as f:
+                files[source] = f.read()
+        except OSError:
+            files[source] = None
+    return files
+
+
+def _source_files(path: str) -> list[str]:
+    """The root file followed by every file it sources, transitively."""
+    return _core_source_files(os.fspath(path), False)
+
+
+def _stat_stamp(path: str) -> tuple[int, int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class _StatWatcher:
+    """Stat-polling stand-in for _core.FileWatcher where inotify isn't available."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._stamps: dict[str, tuple[int, int, int] | None] = {}
+        self._changed: list[str] = []
+
+    def watch(self, paths: list[str]) -> None:
+        # Known files keep their old stamp, so an edit made while the
+        # caller was busy still shows up on the next scan.
+        stamps = {}
+        for path in map(os.path.abspath, paths):
+            stamps[path] = self._stamps[path] if path in self._stamps else _stat_stamp(path)
+        self._stamps = stamps
+
+    def wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            self._scan()
+            remaining = deadline - time.monotonic()
+            if self._changed or remaining <= 0:
+                return bool(self._changed)
+            time.sleep(min(self._interval, remaining))
+
+    def read(self) -> list[str]:
+        self._scan()
+        changed, self._changed = self._changed, []
+        return changed
+
+    def _scan(self) -> None:
+        for path, stamp in self._stamps.items():
+            current = _stat_stamp(path)
+            if current != stamp:
+                self._stamps[path] = current
+                if path not in self._changed:
+                    self._changed.append(path)
+
+
+class ConfigSnapshot(NamedTuple):
+    """One successfully parsed state of a watched config file."""
+
+    config: Config
+    values: dict[str, object]
+    generation: int
+
+
+class ConfigWatcher:
+    """Reparse a config file in the background when it or a sourced file changes.
+
+    Files are watched with inotify where available, otherwise by polling
+    their stat. A burst of writes is coalesced: the reparse starts once no
+    event has arrived for debounce seconds. Each reparse builds a fresh
+    Config; only if it parses cleanly does it replace the current snapshot,
+    in a single assignment, so readers never block or see a partial parse.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        schema: Schema | dict | None = None,
+        *,
+        setup: Callable[[Config], None] | None = None,
+        on_reload: Callable[[ConfigSnapshot], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        debounce: float = 0.05,
+        poll_interval: float = 0.5,
+        polling: bool = False,
+        verify_only: bool = False,
+        throw_all_errors: bool = False,
+        allow_missing_config: bool = False,
+    ) -> None:
+        self._path = os.path.abspath(path)
+        self._schema = None if schema is None else _as_schema(schema)
+        self._setup = setup
+        self._on_reload = on_reload
+        self._on_error = on_error
+        self._debounce = debounce
+        self._poll_interval = poll_interval
+        self._polling = polling
+        self._options = {
+            "verify_only": verify_only,
+            "throw_all_errors": throw_all_errors,
+            "allow_missing_config": allow_missing_config,
+        }
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.last_error: Exception | None = None
+        self._snapshot = self._build(0)
+        self._files = _source_files(self._path)
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """The latest successfully parsed state. Never blocks."""
+        return self._snapshot
+
+    @property
+    def files(self) -> list[str]:
+        """The root file and every file it sources, as currently watched."""
+        return list(self._files)
+
+    def reload(self) -> bool:
+        """Reparse now, on the calling thread. Returns whether it succeeded.
+
+        On failure the previous snapshot stays current and the error is
+        stored in last_error and passed to on_error.
+        """
+        snapshot = self._reload()
+        if snapshot is not None and self._on_reload is not None:
+            self._on_reload(snapshot)
+        return snapshot is not None
+
+    def start(self) -> ConfigWatcher:
+        """Start watching on a daemon thread. Callbacks run on that thread."""
+        if self._thread is None:
+            self._stop.clear()
+            # Watch before returning, so edits made right after start() count.
+            watcher = self._open_watcher()
+            watcher.watch(self._files)
+            self._thread = threading.Thread(
+                target=self._run, args=(watcher,), name="hyprlang-watcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop watching and wait for the thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> ConfigWatcher:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    async def __aiter__(self) -> AsyncIterator[ConfigSnapshot]:
+        """Yield a snapshot after every successful reload.
+
+        Driven by the running event loop: the inotify descriptor is
+        registered with loop.add_reader (or stat is polled with
+        asyncio.sleep), and only the parse and the rescan of sourced files
+        run in a worker thread.
+        Use this instead of start(), not alongside it.
+        """
+        loop = asyncio.get_running_loop()
+        watcher = self._open_watcher()
+        watcher.watch(self._files)
+        fd = watcher.fileno() if hasattr(watcher, "fileno") else None
+        changed: list[str] = []
+        ready = asyncio.Event()
+
+        def drain() -> None:
+            changed.extend(watcher.read())
+            if changed:
+                ready.set()
+
+        if fd is not None:
+            loop.add_reader(fd, drain)
+        try:
+            while True:
+                if fd is None:
+                    while not changed:
+                        await asyncio.sleep(self._poll_interval)
+                        drain()
+                await ready.wait()
+                # Wait out the burst: stop once a debounce period adds nothing.
+                seen = -1
+                while seen != len(changed):
+                    seen = len(changed)
+                    await asyncio.sleep(self._debounce)
+                    if fd is None:
+                        drain()
+                changed.clear()
+                ready.clear()
+
+                snapshot, self._files = await asyncio.to_thread(self._reload_sources)
+                watcher.watch(self._files)
+                if snapshot is not None:
+                    if self._on_reload is not None:
+                        self._on_reload(snapshot)
+                    yield snapshot
+        finally:
+            if fd is not None:
+                loop.remove_reader(fd)
+
+    def _reload(self) -> ConfigSnapshot | None:
+        with self._reload_lock:
+            try:
+                snapshot = self._build(self._snapshot.generation + 1)
+            except (HyprlangError, OSError) as e:
+                self.last_error = e
+                if self._on_error is not None:
+                    self._on_error(e)
+                return None
+            self._snapshot = snapshot
+            self.last_error = None
+        return snapshot
+
+    def _reload_sources(self) -> tuple[ConfigSnapshot | None, list[str]]:
+        """Reparse, then list the files to watch; both read from disk."""
+        return self._reload(), _source_files(self._path)
+
+    def _build(self, generation: int) -> ConfigSnapshot:
+        config = Config(self._path, schema=self._schema, **self._options)
+        if self._setup is not None:
+            self._setup(config)
+        if self._schema is None:
+            config.capture()
+        config.commence()
+        config.parse()
+        return ConfigSnapshot(config, config.to_dict(), generation)
+
+    def _open_watcher(self) -> _FileWatcher | _StatWatcher:
+        if _FileWatcher is not None and not self._polling:
+            try:
+                return _FileWatcher()
+            except OSError:
+                pass
+        return _StatWatcher(self._poll_interval)
+
+    def _run(self, watcher: _FileWatcher | _StatWatcher) -> None:
+        while not self._stop.is_set():
+            if not watcher.wait(self._poll_interval):
+                continue
+            changed = watcher.read()
+            while not self._stop.is_set() and watcher.wait(self._debounce):
+                changed.extend(watcher.read())
+            if not changed or self._stop.is_set():
+                continue
+            self.reload()
+            self._files = _source_files(self._path)
+            watcher.watch(self._files)
+
+
+_CACHE_MAGIC = b"HLPC\x01" + bytes([marshal.version])
+
+
+def _cache_key(
+    sources: dict[str, bytes | None],
+    schema: Schema | None,
+    options: dict[str, bool],
+) -> str:
+    """Hash of every source file's path and content, the schema and options."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(_CACHE_MAGIC)
+    for source, content in sources.items():
+        digest.update(source.encode() + b"\0")
+        if content is None:
+            digest.update(b"\0missing")
+        else:
+            digest.update(hashlib.blake2b(content, digest_size=20).digest())
+    # An inferred schema is fully determined by the sources' contents, and
+    # sources are found by the same walk that inference does.
+    fingerprint = "inferred" if schema is None else schema.fingerprint
+    digest.update(fingerprint.encode())
+    digest.update(repr(sorted(options.items())).encode())
+    return digest.hexdigest()
+
+
+def _cache_load(cache_dir: str, key: str) -> dict[str, object] | None:
+    entry = os.path.join(cache_dir, key + ".hlc")
+    try:
+        with open(entry, "rb") as f:
+            blob = f.read()
+    except OSError:
+        return None
+    values = None
+    if blob.startswith(_CACHE_MAGIC):
+        try:
+            values = marshal.loads(blob[len(_CACHE_MAGIC) :])
+        except (EOFError, ValueError, TypeError):
+            pass
+    if isinstance(values, dict):
+        return values
+    # A truncated or foreign entry: drop it, so it isn't read again.
+    try:
+        os.unlink(entry)
+    except OSError:
+        pass
+    return None
+
+
+def _cache_store(cache_dir: str, key: str, values: dict[str, object]) -> None:
+    # Write to a temporary file and rename it over the entry, so readers
+    # only ever see a missing or complete blob. Failing to cache is not an
+    # error.
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_CACHE_MAGIC + marshal.dumps(values))
+            os.replace(tmp, os.path.join(cache_dir, key + ".hlc"))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
 def parse_file(
     path: str,
-    schema: dict | None = None,
+    schema: Schema | dict | None = None,
     *,
     verify_only: bool = False,
     throw_all_errors: bool = False,
     allow_missing_config: bool = False,
-) -> dict[str, object]:
+    cache_dir: str | None = None,
+    lazy: bool = False,
+) -> dict[str, object] | ConfigView:
     """Parse a hyprlang config file and return values as a nested dict.
 
-    If schema is None, the file is pre-scanned to infer keys and types.
+    If schema is None, keys and types are captured from the file (see
+    Config.capture()).
+    With cache_dir, results are stored there and reused, without parsing,
+    while the file, everything it sources, the schema and options are
+    unchanged.
+    With lazy=True, a ConfigView is returned instead, and only the values
+    that are read get converted. It can't be combined with cache_dir.
     """
-    if schema is None:
-        with open(path) as f:
-            flat_pairs = list(_infer_schema(f.read()).items())
-    else:
-        flat_pairs = _flatten_schema(schema)
+    options = {
+        "verify_only": verify_only,
+        "throw_all_errors": throw_all_errors,
+        "allow_missing_config": allow_missing_config,
+    }
+    if lazy and cache_dir is not None:
+        raise ValueError("lazy=True can't be combined with cache_dir")
+    if schema is not None:
+        schema = _as_schema(schema)
+    if cache_dir is not None:
+        cache_dir = os.fspath(cache_dir)
+        key = _cache_key(_read_sources(path), schema, options)
+        cached = _cache_load(cache_dir, key)
+        if cached is not None:
+            return cached
 
-    config = Config(
-        path,
-        verify_only=verify_only,
-        throw_all_errors=throw_all_errors,
-        allow_missing_config=allow_missing_config,
-    )
-    for key, default in flat_pairs:
-        config.add(key, default)
+    config = Config(path, schema=schema, **options)
+    if schema is None:
+        config.capture()
     config.commence()
     config.parse()
-    return config.to_dict()
+    if lazy:
+        return config.view()
+    values = config.to_dict()
+    if cache_dir is not None:
+        _cache_store(cache_dir, key, values)
+    return values
+
+
+def infer_file_schema(path: str) -> tuple[Schema, dict[str, list[str]]]:
+    """Infer a schema from a config file and everything it sources.
+
+    Sources are followed as libhyprlang follows them: relative paths start
+    at the directory of the file with the source line, and ``$VAR``s defined
+    earlier are expanded. Each file's scan is memoized by path, mtime and
+    size, for the 256 most recently used files, so an include shared by many
+    configs is read once. Returns the schema and the include graph:
+    every file read, in order, mapped to the files it sources.
+    """
+    values, graph = _core_infer_file_schema(os.fspath(path))
+    return Schema(values), graph
+
+
+class ParseCache:
+    """A bounded, thread-safe LRU of parse_string() results.
+
+    Entries are keyed like the parse_file() disk cache, on the text, the
+    path and content of every file it sources, the schema fingerprint and
+    options, and held as marshal blobs: every hit returns a fresh dict, so
+    callers can't change what is cached. The least recently used entries
+    are evicted once there are more than max_entries or their blobs take
+    more than max_bytes.
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024
+    ) -> None:
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be positive")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss/eviction counters plus current entries and bytes."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def clear(self) -> None:
+        """Drop every entry. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _get(self, key: str) -> dict[str, object] | None:
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return marshal.loads(blob)
+
+    def _put(self, key: str, values: dict[str, object]) -> None:
+        blob = marshal.dumps(values)
+        if len(blob) > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = blob
+            self._bytes += len(blob)
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self._evictions += 1
 
 
 def parse_string(
     text: str,
-    schema: dict | None = None,
+    schema: Schema | dict | None = None,
     *,
     verify_only: bool = False,
     throw_all_errors: bool = False,
+    cache: ParseCache | None = None,
 ) -> dict[str, object]:
     """Parse a hyprlang config string and return values as a nested dict.
 
     If schema is None, the text is pre-scanned to infer keys and types.
+    With cache, repeated texts are answered from it without parsing.
     """
+    options = {"verify_only": verify_only, "throw_all_errors": throw_all_errors}
+    if schema is not None:
+        schema = _as_schema(schema)
+    if cache is not None:
+        sources = {"": text.encode()}
+        if "source" in text:
+            sources.update(_read_sources(text, is_stream=True))
+        key = _cache_key(sources, schema, options)
+        cached = cache._get(key)
+        if cached is not None:
+            return cached
+
+    config = Config(text, is_stream=True, schema=schema, **options)
     if schema is None:
-        flat_pairs = list(_infer_schema(text).items())
-    else:
-        flat_pairs = _flatten_schema(schema)
+        config.capture()
+    config.commence()
+    config.parse()
+    values = config.to_dict()
+    if cache is not None:
+        cache._put(key, values)
+    return values
+
+
+async def aparse_file(
+    path: str,
+    schema: Schema | dict | None = None,
+    *,
+    verify_only: bool = False,
+    throw_all_errors: bool = False,
+    allow_missing_config: bool = False,
+    cache_dir: str | None = None,
+    lazy: bool = False,
+) -> dict[str, object] | ConfigView:
+    """Like parse_file(), but runs off the event loop in a worker thread.
+
+    The native parse releases the GIL, so the loop keeps running meanwhile.
+    """
+    return await asyncio.to_thread(
+        parse_file,
+        path,
+        schema,
+        verify_only=verify_only,
+        throw_all_errors=throw_all_errors,
+        allow_missing_config=allow_missing_config,
+        cache_dir=cache_dir,
+        lazy=lazy,
+    )
 
-    config = Config(
+
+async def aparse_string(
+    text: str,
+    schema: Schema | dict | None = None,
+    *,
+    verify_only: bool = False,
+    throw_all_errors: bool = False,
+    cache: ParseCache | None = None,
+) -> dict[str, object]:
+    """Like parse_string(), but runs off the event loop in a worker thread."""
+    return await asyncio.to_thread(
+        parse_string,
         text,
+        schema,
         verify_only=verify_only,
         throw_all_errors=throw_all_errors,
-        is_stream=True,
+        cache=cache,
     )
-    for key, default in flat_pairs:
-        config.add(key, default)
-    config.commence()
-    config.parse()
-    return config.to_dict()
+
+
+class ParseOutcome(NamedTuple):
+    """The outcome of one input of a batch parse.
+
+    Exactly one of values and error is set.
+    """
+
+    source: str
+    values: dict[str, object] | None
+    error: Exception | None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# Per-process state of parse_many() workers, set up once by the initializer.
+_worker_parse: Callable[[str], dict[str, object]] | None = None
+
+
+def _init_parse_worker(schema: Schema | None, options: dict[str, bool]) -> None:
+    global _worker_parse
+    if schema is None:
+        _worker_parse = functools.partial(parse_file, **options)
+    else:
+        _worker_parse = ConfigPool(schema, size=1, **options).parse_file
+
+
+def _parse_chunk(paths: list[str]) -> list[ParseOutcome]:
+    outcomes = []
+    for path in paths:
+        try:
+            outcomes.append(ParseOutcome(path, _worker_parse(os.fspath(path)), None))
+        except Exception as e:
+            outcomes.append(ParseOutcome(path, None, e))
+    return outcomes
+
+
+class _PendingChunk(NamedTuple):
+    future: Future[list[ParseOutcome]]
+    paths: list[str]
+    executor: ProcessPoolExecutor
+
+
+def parse_many(
+    paths: Iterable[str],
+    schema: Schema | dict | None = None,
+    *,
+    processes: int | None = None,
+    chunksize: int = 16,
+    ordered: bool = True,
+    max_pending: int | None = None,
+    verify_only: bool = False,
+    throw_all_errors: bool = False,
+    allow_missing_config: bool = False,
+) -> Iterator[ParseOutcome]:
+    """Parse many config files in worker processes, yielding a ParseOutcome each.
+
+    Each worker compiles the schema once and reuses one parser. Files are
+    sent in chunks of chunksize, with at most max_pending chunks (default
+    twice the process count) submitted at a time, so paths may be a lazy
+    iterable of any length. Results come back in input order, or as chunks
+    complete with ordered=False. A file that fails to parse yields an
+    outcome with error set. If a worker dies, the files of each chunk lost
+    with it are retried one at a time in a separate single-worker pool, so
+    only a file that kills the worker again fails, with BrokenProcessPool.
+    """
+    if schema is not None:
+        schema = _as_schema(schema)
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    processes = processes or os.cpu_count() or 1
+    limit = max_pending or 2 * processes
+    options = {
+        "verify_only": verify_only,
+        "throw_all_errors": throw_all_errors,
+        "allow_missing_config": allow_missing_config,
+    }
+
+    def new_executor(workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            workers, initializer=_init_parse_worker, initargs=(schema, options)
+        )
+
+    def submit(chunk: list[str]) -> _PendingChunk:
+        nonlocal executor
+        try:
+            future = executor.submit(_parse_chunk, chunk)
+        except BrokenProcessPool:
+            executor.shutdown(wait=False)
+            executor = new_executor(processes)
+            future = executor.submit(_parse_chunk, chunk)
+        return _PendingChunk(future, chunk, executor)
+
+    def isolate(chunk: list[str]) -> list[ParseOutcome]:
+        # One file in flight at a time, so a crash here is that file's.
+        nonlocal isolation
+        outcomes = []
+        for path in chunk:
+            if isolation is None:
+                isolation = new_executor(1)
+            try:
+                outcomes.extend(isolation.submit(_parse_chunk, [path]).result())
+            except BrokenProcessPool as e:
+                isolation.shutdown(wait=False)
+                isolation = None
+                outcomes.append(ParseOutcome(path, None, e))
+        return outcomes
+
+    executor = new_executor(processes)
+    isolation: ProcessPoolExecutor | None = None
+    items = iter(paths)
+    pending: deque[_PendingChunk] = deque()
+    try:
+        while True:
+            while len(pending) < limit:
+                chunk = list(itertools.islice(items, chunksize))
+                if not chunk:
+                    break
+                pending.append(submit(chunk))
+            if not pending:
+                return
+
+            if ordered:
+                entry = pending[0]
+            else:
+                done, _ = wait([p.future for p in pending], return_when=FIRST_COMPLETED)
+                entry = next(p for p in pending if p.future in done)
+            pending.remove(entry)
+
+            try:
+                outcomes = entry.future.result()
+            except BrokenProcessPool:
+                if entry.executor is executor:
+                    executor.shutdown(wait=False)
+                    executor = new_executor(processes)
+                outcomes = isolate(entry.paths)
+            yield from outcomes
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        if isolation is not None:
+            isolation.shutdown(wait=False)
+
+
+_STOP = object()
+
+
+def iter_parse(
+    items: Iterable[str],
+    schema: Schema | dict | None = None,
+    *,
+    workers: int = 4,
+    is_stream: bool = False,
+    max_pending: int | None = None,
+    verify_only: bool = False,
+    throw_all_errors: bool = False,
+    allow_missing_config: bool = False,
+) -> Iterator[tuple[str, dict[str, object] | Exception]]:
+    """Parse files (or texts, with is_stream=True) on worker threads.
+
+    Yields (item, values) as each item finishes, or (item, exception) if it
+    failed. The native parse releases the GIL, so workers run in parallel.
+    At most max_pending items (default twice workers) are taken from items
+    ahead of what has been yielded.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    limit = max_pending or 2 * workers
+    options = {"verify_only": verify_only, "throw_all_errors": throw_all_errors}
+    if not is_stream:
+        options["allow_missing_config"] = allow_missing_config
+
+    if schema is None:
+        parse_one = functools.partial(parse_string if is_stream else parse_file, **options)
+    else:
+        pool = ConfigPool(schema, size=workers, **options)
+        parse_one = pool.parse_string if is_stream else pool.parse_file
+
+    tasks: queue.SimpleQueue[object] = queue.SimpleQueue()
+    results: queue.SimpleQueue[tuple[str, dict[str, object] | Exception]] = queue.SimpleQueue()
+
+    def work() -> None:
+        while (item := tasks.get()) is not _STOP:
+            try:
+                results.put((item, parse_one(item if is_stream else os.fspath(item))))
+            except Exception as e:
+                results.put((item, e))
+
+    for _ in range(workers):
+        threading.Thread(target=work, name="hyprlang-iter-parse", daemon=True).start()
+
+    source = iter(items)
+    in_flight = 0
+    try:
+        while True:
+            # Only feed the workers as results are consumed, so a slow
+            # consumer holds at most limit items in memory.
+            while in_flight < limit and (item := next(source, _STOP)) is not _STOP:
+                tasks.put(item)
+                in_flight += 1
+            if in_flight == 0:
+                return
+            result = results.get()
+            in_flight -= 1
+            yield result
+    finally:
+        for _ in range(workers):
+            tasks.put(_STOP)
@@ -1,6 +1,10 @@
 """Tests for the high-level Pythonic API."""
 
+import asyncio
 import os
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
 import pytest
 import hyprlang_pybind as hyprlang
 
@@ -92,6 +96,326 @@ class TestParseFile:
         assert data["testCategory"]["innerString"] == "nested value"
 
 
+class TestParseCache:
+    def test_hits_and_copies(self):
+        cache = hyprlang.ParseCache()
+        first = hyprlang.parse_string("x = 1", {"x": 0}, cache=cache)
+        first["x"] = 99
+        second = hyprlang.parse_string("x = 1", {"x": 0}, cache=cache)
+        assert second == {"x": 1}
+        second["x"] = 42
+        assert hyprlang.parse_string("x = 1", {"x": 0}, cache=cache) == {"x": 1}
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+
+    def test_sourced_change_misses(self, tmp_path):
+        extra = tmp_path / "extra.conf"
+        extra.write_text("a = 1\n")
+        cache = hyprlang.ParseCache()
+        text = f"source = {extra}\n"
+        assert hyprlang.parse_string(text, cache=cache) == {"a": 1}
+        assert hyprlang.parse_string(text, cache=cache) == {"a": 1}
+        extra.write_text("a = 2\n")
+        assert hyprlang.parse_string(text, cache=cache) == {"a": 2}
+        assert cache.stats()["hits"] == 1
+
+    def test_dict_schema_compiled_once(self, monkeypatch):
+        flattened = []
+        flatten = hyprlang._flatten_schema
+
+        def count(schema, prefix=""):
+            if not prefix:
+                flattened.append(schema)
+            return flatten(schema, prefix)
+
+        monkeypatch.setattr(hyprlang, "_flatten_schema", count)
+        cache = hyprlang.ParseCache()
+        hyprlang.parse_string("x = 1", {"x": 0}, cache=cache)
+        assert len(flattened) == 1
+        hyprlang.parse_string("x = 1", {"x": 0}, cache=cache)
+        assert len(flattened) == 2
+
+    def test_key_includes_schema_and_options(self):
+        cache = hyprlang.ParseCache()
+        hyprlang.parse_string("x = 1", {"x": 0}, cache=cache)
+        hyprlang.parse_string("x = 1", {"x": 5}, cache=cache)
+        hyprlang.parse_string("x = 1", cache=cache)
+        hyprlang.parse_string("x = 1", {"x": 0}, cache=cache, verify_only=True)
+        assert cache.stats()["misses"] == 4
+
+    def test_entry_eviction(self):
+        cache = hyprlang.ParseCache(max_entries=2)
+        for text in ("x = 1", "x = 2", "x = 1", "x = 3"):
+            hyprlang.parse_string(text, {"x": 0}, cache=cache)
+        # "x = 2" was least recently used when "x = 3" arrived.
+        assert cache.stats()["evictions"] == 1
+        hyprlang.parse_string("x = 1", {"x": 0}, cache=cache)
+        assert cache.stats()["hits"] == 2
+
+    def test_memory_eviction(self):
+        cache = hyprlang.ParseCache(max_bytes=200)
+        for i in range(20):
+            hyprlang.parse_string(f"s = {'a' * 40}{i}", {"s": ""}, cache=cache)
+        stats = cache.stats()
+        assert stats["bytes"] <= 200
+        assert stats["evictions"] == 20 - stats["entries"]
+
+    def test_errors_not_cached(self):
+        cache = hyprlang.ParseCache()
+        for _ in range(2):
+            with pytest.raises(hyprlang.HyprlangError):
+                hyprlang.parse_string("x = nope", {"x": 0}, cache=cache)
+        assert len(cache) == 0
+
+
+class TestSchemaInference:
+    def test_parse_string_without_schema(self):
+        data = hyprlang.parse_string("a = 1\ncat {\n  b = 2.5\n  c = 1 2\n}")
+        assert data == {"a": 1, "cat": {"b": 2.5, "c": (1.0, 2.0)}}
+
+    def test_file_follows_changes(self, tmp_path):
+        path = tmp_path / "a.conf"
+        path.write_text("a = 1\n")
+        assert hyprlang.parse_file(str(path)) == {"a": 1}
+
+        path.write_text("a = 1\nb = two\n")
+        assert hyprlang.parse_file(str(path)) == {"a": 1, "b": "two"}
+
+    def test_file_with_sources(self, tmp_path):
+        (tmp_path / "extra.conf").write_text("cat {\n  y = 2.5\n}\n")
+        root = tmp_path / "main.conf"
+        root.write_text("x = 1\nsource = extra.conf\n")
+        assert hyprlang.parse_file(str(root)) == {"x": 1, "cat": {"y": 2.5}}
+
+        config = hyprlang.Config(str(root))
+        config.capture()
+        assert config.include_graph == {
+            str(root): [str(tmp_path / "extra.conf")],
+            str(tmp_path / "extra.conf"): [],
+        }
+        schema, graph = hyprlang.infer_file_schema(root)
+        assert schema.keys == ("x", "cat:y")
+        assert graph == config.include_graph
+
+    def test_file_with_nested_relative_sources(self, tmp_path):
+        (tmp_path / "conf.d").mkdir()
+        (tmp_path / "conf.d" / "c.conf").write_text("c = 1\nsource = d.conf\n")
+        (tmp_path / "conf.d" / "d.conf").write_text("d = 3\n")
+        root = tmp_path / "main.conf"
+        root.write_text("source = conf.d/c.conf\n")
+        assert hyprlang.parse_file(str(root)) == {"c": 1, "d": 3}
+
+    def test_capture_keeps_registered_values(self):
+        config = hyprlang.Config("a = 1\nb = 2.5", is_stream=True)
+        config.add("a", "x")
+        assert config.capture() == {"b": 0.0}
+        config.commence()
+        config.parse()
+        assert config.to_dict() == {"a": "1", "b": 2.5}
+
+
+class TestParseFileCache:
+    SCHEMA = {"x": 0, "cat": {"y": ""}}
+
+    @pytest.fixture
+    def root(self, tmp_path):
+        root = tmp_path / "main.conf"
+        root.write_text("x = 1\nsource = extra.conf\n")
+        (tmp_path / "extra.conf").write_text("cat {\n  y = hi\n}\n")
+        return root
+
+    def _no_parse(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("parsed despite a cache hit")
+
+        monkeypatch.setattr(hyprlang, "Config", fail)
+
+    def test_hit_skips_parse(self, root, tmp_path, monkeypatch):
+        cache = tmp_path / "cache"
+        first = hyprlang.parse_file(str(root), self.SCHEMA, cache_dir=cache)
+        assert first == {"x": 1, "cat": {"y": "hi"}}
+        assert len(list(cache.iterdir())) == 1
+
+        self._no_parse(monkeypatch)
+        second = hyprlang.parse_file(str(root), self.SCHEMA, cache_dir=cache)
+        assert second == first
+        assert second is not first
+
+    def test_dict_schema_compiled_once(self, root, tmp_path, monkeypatch):
+        flattened = []
+        flatten = hyprlang._flatten_schema
+
+        def count(schema, prefix=""):
+            if not prefix:
+                flattened.append(schema)
+            return flatten(schema, prefix)
+
+        monkeypatch.setattr(hyprlang, "_flatten_schema", count)
+        cache = tmp_path / "cache"
+        hyprlang.parse_file(str(root), self.SCHEMA, cache_dir=cache)
+        assert len(flattened) == 1
+        hyprlang.parse_file(str(root), self.SCHEMA, cache_dir=cache)
+        assert len(flattened) == 2
+
+    def test_sourced_change_misses(self, root, tmp_path):
+        cache = tmp_path / "cache"
+        hyprlang.parse_file(str(root), self.SCHEMA, cache_dir=cache)
+        (tmp_path / "extra.conf").write_text("cat {\n  y = bye\n}\n")
+        data = hyprlang.parse_file(str(root), self.SCHEMA, cache_dir=cache)
+        assert data["cat"]["y"] == "bye"
+
+    def test_nested_relative_source_change_misses(self, tmp_path):
+        (tmp_path / "conf.d").mkdir()
+        (tmp_path / "conf.d" / "c.conf").write_text("source = d.conf\n")
+        (tmp_path / "conf.d" / "d.conf").write_text("d = 3\n")
+        root = tmp_path / "main.conf"
+        root.write_text("source = conf.d/c.conf\n")
+        cache = tmp_path / "cache"
+        assert hyprlang.parse_file(str(root), cache_dir=cache) == {"d": 3}
+        (tmp_path / "conf.d" / "d.conf").write_text("d = 99\n")
+        assert hyprlang.parse_file(str(root), cache_dir=cache) == {"d": 99}
+
+    def test_schema_and_options_in_key(self, root, tmp_path):
+        cache = tmp_path / "cache"
+        hyprlang.parse_file(str(root), self.SCHEMA, cache_dir=cache)
+        hyprlang.parse_file(str(root), {"x": 0, "cat": {"y": "d"}}, cache_dir=cache)
+        hyprlang.parse_file(str(root), self.SCHEMA, cache_dir=cache, verify_only=True)
+        assert len(list(cache.iterdir())) == 3
+
+    def test_corrupt_entry_is_a_miss(self, root, tmp_path):
+        cache = tmp_path / "cache"
+        hyprlang.parse_file(str(root), self.SCHEMA, cache_dir=cache)
+        (entry,) = cache.iterdir()
+        entry.write_bytes(b"garbage")
+        assert hyprlang.parse_file(str(root), self.SCHEMA, cache_dir=cache)["x"] == 1
+
+    def test_non_dict_entry_is_a_miss(self, root, tmp_path, monkeypatch):
+        import marshal
+
+        cache = tmp_path / "cache"
+        hyprlang.parse_file(str(root), self.SCHEMA, cache_dir=cache)
+        (entry,) = cache.iterdir()
+        entry.write_bytes(hyprlang._CACHE_MAGIC + marshal.dumps([1, 2]))
+        monkeypatch.setattr(hyprlang, "_cache_store", lambda *args: None)
+        assert hyprlang.parse_file(str(root), self.SCHEMA, cache_dir=cache)["x"] == 1
+        assert not entry.exists()
+
+    def test_errors_not_cached(self, tmp_path):
+        root = tmp_path / "bad.conf"
+        root.write_text("x = nope\n")
+        cache = tmp_path / "cache"
+        with pytest.raises(hyprlang.HyprlangError):
+            hyprlang.parse_file(str(root), {"x": 0}, cache_dir=cache)
+        assert not cache.exists() or not list(cache.iterdir())
+
+
+class TestSchema:
+    SCHEMA = {
+        "general": {"border": 1, "gap": 0.5, "layout": "dwindle"},
+        "pos": (0.0, 0.0),
+    }
+
+    def test_table(self):
+        schema = hyprlang.Schema(self.SCHEMA)
+        assert schema.keys == ("general:border", "general:gap", "general:layout", "pos")
+        assert schema.types["general:gap"] == hyprlang.ValueType.FLOAT
+        assert schema.types["pos"] == hyprlang.ValueType.VEC2
+        assert len(schema) == 4
+
+    def test_fingerprint(self):
+        a = hyprlang.Schema(self.SCHEMA)
+        b = hyprlang.Schema(
+            {
+                "general": {"border": 1, "gap": 0.5, "layout": "dwindle"},
+                "pos": (0.0, 0.0),
+            }
+        )
+        c = hyprlang.Schema({"general": {"border": 2}})
+        assert a.fingerprint == b.fingerprint
+        assert a == b
+        assert a.fingerprint != c.fingerprint
+
+    def test_reuse(self):
+        schema = hyprlang.Schema(self.SCHEMA)
+        for border in (3, 4):
+            data = hyprlang.parse_string(f"general:border = {border}", schema=schema)
+            assert data == {
+                "general": {"border": border, "gap": 0.5, "layout": "dwindle"},
+                "pos": (0.0, 0.0),
+            }
+
+    def test_config_schema(self):
+        config = hyprlang.Config(
+            "general:border = 9",
+            is_stream=True,
+            schema=hyprlang.Schema(self.SCHEMA),
+        )
+        config.add("extra", 7)
+        config.commence()
+        config.parse()
+        assert config["general:border"] == 9
+        assert config.to_dict()["extra"] == 7
+
+    def test_invalid_default(self):
+        with pytest.raises(ValueError):
+            hyprlang.Schema({"bad": []})
+
+
+class TestConfigPool:
+    SCHEMA = {"a": 0, "cat": {"s": "default"}}
+
+    def test_parse_string_resets(self):
+        pool = hyprlang.ConfigPool(self.SCHEMA, size=1)
+        assert pool.parse_string("a = 1\ncat:s = x") == {"a": 1, "cat": {"s": "x"}}
+        assert pool.parse_string("a = 2") == {"a": 2, "cat": {"s": "default"}}
+
+    def test_parse_file(self):
+        pool = hyprlang.ConfigPool(
+            {
+                "testInt": 0,
+                "testFloat": 0.0,
+                "testString": "",
+                "testVar": 0,
+                "testColor": 0,
+                "testCategory": {"innerInt": 0, "innerString": ""},
+                "testVec": (0.0, 0.0),
+                "testBool": 0,
+            },
+            size=1,
+        )
+        for _ in range(2):
+            data = pool.parse_file(TEST_CONF)
+            assert data["testInt"] == 123
+            assert data["testCategory"]["innerString"] == "nested value"
+
+    def test_error_returns_parser(self):
+        pool = hyprlang.ConfigPool(self.SCHEMA, size=1)
+        with pytest.raises(hyprlang.HyprlangError):
+            pool.parse_string("cat {\n  s = x\n")
+        assert pool.parse_string("a = 3")["a"] == 3
+
+    def test_bounded(self):
+        pool = hyprlang.ConfigPool(self.SCHEMA, size=1)
+        with pool.checkout("a = 1", is_stream=True):
+            with pytest.raises(TimeoutError):
+                with pool.checkout("a = 2", is_stream=True, timeout=0.01):
+                    pass
+
+    def test_threads(self):
+        pool = hyprlang.ConfigPool(self.SCHEMA, size=2)
+        results = {}
+
+        def worker(i):
+            results[i] = pool.parse_string(f"a = {i}")["a"]
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == {i: i for i in range(16)}
+
+
 class TestConfigClass:
     def test_basic_usage(self):
         config = hyprlang.Config(
@@ -131,6 +455,59 @@ class TestConfigClass:
         d = config.to_dict()
         assert d == {"cat": {"a": 10, "b": 20}}
 
+    def test_changed_since(self):
+        config = hyprlang.Config("x = 1\ny = 2", is_stream=True)
+        config.add_many([("x", 0), ("y", 0)])
+        config.commence()
+        config.parse()
+        gen = config.generation
+        view = config.to_dict(incremental=True)
+
+        config.parse_dynamic("y = 3")
+        assert config.changed_since(gen) == ["y"]
+        assert config.to_dict(incremental=True) == {"x": 1, "y": 3}
+        assert view["y"] == 3
+
+    def test_to_dict_flat(self):
+        config = hyprlang.Config("cat {\n  a = 10\n}\n", is_stream=True)
+        config.add("cat:a", 0)
+        config.add("top", 5)
+        config.commence()
+        config.parse()
+
+        assert config.to_dict(flat=True) == {"cat:a": 10, "top": 5}
+
+    def test_add_many(self):
+        config = hyprlang.Config("x = 1\ncat:y = 2.0", is_stream=True)
+        config.add_many([("x", 0), ("cat:y", 0.0)])
+        config.commence()
+        config.parse()
+
+        assert config.to_dict() == {"x": 1, "cat": {"y": 2.0}}
+        with pytest.raises(hyprlang.HyprlangError):
+            config.add_many([("z", 0)])
+
+    def test_get_many(self):
+        config = hyprlang.Config("x = 1\ny = 2", is_stream=True)
+        config.add("x", 0)
+        config.add("y", 0)
+        config.commence()
+        config.parse()
+
+        assert config.get_many(["y", "x"]) == [2, 1]
+        assert config.get_many(["x", "missing"], [0, "d"]) == [1, "d"]
+
+    def test_get_handle(self):
+        config = hyprlang.Config("x = 1", is_stream=True)
+        config.add("x", 0)
+        config.commence()
+        config.parse()
+
+        handle = config.get_handle("x")
+        assert handle.value == 1
+        config.parse_dynamic("x = 2")
+        assert handle.value == 2
+
     def test_is_set_by_user(self):
         config = hyprlang.Config("a = 1", is_stream=True)
         config.add("a", 0)
@@ -172,6 +549,58 @@ class TestConfigClass:
         with pytest.raises(hyprlang.HyprlangError):
             config.add("y", 0)
 
+    def test_on_keyword(self):
+        config = hyprlang.Config(
+            "bind = SUPER, Q, killactive\nbind = SUPER, F, fullscreen",
+            is_stream=True,
+        )
+        seen = []
+        config.on_keyword("bind", lambda cmd, val: seen.append(val))
+        config.commence()
+        config.parse()
+        assert seen == ["SUPER, Q, killactive", "SUPER, F, fullscreen"]
+
+    def test_on_keyword_batch_error(self):
+        config = hyprlang.Config("exec = x", is_stream=True)
+        config.on_keyword("exec", lambda lines: "bad exec", batch=True)
+        config.commence()
+        with pytest.raises(hyprlang.HyprlangError, match="bad exec"):
+            config.parse()
+
+    def test_collector(self):
+        config = hyprlang.Config(
+            "bind = SUPER, Q, killactive\nbindm = SUPER, mouse:272, movewindow",
+            is_stream=True,
+        )
+        config.add_collector("bind", split=True, allow_flags=True)
+        config.commence()
+        config.parse()
+        assert config.get_collected("bind") == [
+            ("bind", ("SUPER", "Q", "killactive")),
+            ("bindm", ("SUPER", "mouse:272", "movewindow")),
+        ]
+
+    def test_special_table(self):
+        config = hyprlang.Config(
+            "dev[a] {\n  speed = 2\n}\ndev[b] {\n  speed = 3\n}", is_stream=True
+        )
+        config.add_special_category("dev", key="key")
+        config.add_special_value("dev", "speed", 0)
+        config.commence()
+        config.parse()
+        keys, columns = config.get_special_table("dev", buffers=True)
+        assert keys == ["a", "b"]
+        assert memoryview(columns["speed"]).tolist() == [2, 3]
+
+    def test_parse_dynamic_many(self):
+        config = hyprlang.Config("x = 1", is_stream=True)
+        config.add("x", 0)
+        config.commence()
+        config.parse()
+        results = config.parse_dynamic_many(["x = 2", "y = 3"], rollback=True)
+        assert [r.error for r in results] == [False, True]
+        assert config["x"] == 1
+
     def test_raw_access(self):
         config = hyprlang.Config("x = 1", is_stream=True)
         config.add("x", 0)
@@ -180,6 +609,296 @@ class TestConfigClass:
         assert config.raw.get_value("x") == 1
 
 
+class TestConfigView:
+    TEXT = "a = 1\ncat {\n  b = 2.5\n  sub {\n    c = 1 2\n  }\n}\nd = hi"
+
+    def _config(self):
+        config = hyprlang.Config(self.TEXT, is_stream=True)
+        config.capture()
+        config.commence()
+        config.parse()
+        return config
+
+    def test_matches_to_dict(self):
+        config = self._config()
+        view = config.view()
+        assert list(view) == ["a", "cat", "d"]
+        assert len(view) == 3
+        assert "cat" in view and "b" not in view
+        assert view == config.to_dict()
+        assert config.to_dict() == view
+        assert view["cat"]["sub"]["c"] == (1.0, 2.0)
+
+    def test_entries_are_cached(self):
+        view = self._config().view()
+        assert isinstance(view["cat"], hyprlang.ConfigView)
+        assert view["cat"] is view["cat"]
+        assert view["d"] is view["d"]
+        with pytest.raises(KeyError):
+            view["missing"]
+        with pytest.raises(TypeError):
+            view["a"] = 2
+
+    def test_parse_file_lazy(self, tmp_path):
+        path = tmp_path / "a.conf"
+        path.write_text(self.TEXT)
+        view = hyprlang.parse_file(str(path), lazy=True)
+        assert isinstance(view, hyprlang.ConfigView)
+        assert view == hyprlang.parse_file(str(path))
+        with pytest.raises(ValueError):
+            hyprlang.parse_file(str(path), lazy=True, cache_dir=tmp_path / "cache")
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestConfigWatcher:
+    @pytest.fixture
+    def files(self, tmp_path):
+        root = tmp_path / "main.conf"
+        extra = tmp_path / "extra.conf"
+        root.write_text("x = 1\nsource = extra.conf\n")
+        extra.write_text("y = 2\n")
+        return root, extra
+
+    def test_initial_snapshot(self, files):
+        root, extra = files
+        watcher = hyprlang.ConfigWatcher(str(root), {"x": 0, "y": 0})
+        assert watcher.snapshot.values == {"x": 1, "y": 2}
+        assert watcher.snapshot.generation == 0
+        assert watcher.files == [str(root), str(extra)]
+
+    @pytest.mark.parametrize("polling", [False, True])
+    def test_reload_on_sourced_change(self, files, polling):
+        root, extra = files
+        reloads = []
+        watcher = hyprlang.ConfigWatcher(
+            str(root),
+            {"x": 0, "y": 0},
+            on_reload=reloads.append,
+            debounce=0.05,
+            poll_interval=0.02,
+            polling=polling,
+        )
+        with watcher:
+            for i in range(3, 8):
+                extra.write_text(f"y = {i}\n")
+            assert _wait_for(lambda: watcher.snapshot.values["y"] == 7)
+        assert len(reloads) <= 2
+        assert reloads[-1] is watcher.snapshot
+
+    @pytest.mark.parametrize("polling", [False, True])
+    def test_reload_on_nested_include(self, tmp_path, polling):
+        (tmp_path / "conf.d").mkdir()
+        nested = tmp_path / "conf.d" / "d.conf"
+        (tmp_path / "conf.d" / "c.conf").write_text("source = d.conf\n")
+        nested.write_text("d = 3\n")
+        root = tmp_path / "main.conf"
+        root.write_text("source = conf.d/c.conf\n")
+        watcher = hyprlang.ConfigWatcher(
+            str(root), debounce=0.05, poll_interval=0.02, polling=polling
+        )
+        assert str(nested) in watcher.files
+        with watcher:
+            nested.write_text("d = 99\n")
+            assert _wait_for(lambda: watcher.snapshot.values == {"d": 99})
+
+    def test_failed_reload_keeps_snapshot(self, files):
+        root, _ = files
+        errors = []
+        watcher = hyprlang.ConfigWatcher(
+            str(root), {"x": 0, "y": 0}, on_error=errors.append, poll_interval=0.02
+        )
+        before = watcher.snapshot
+        with watcher:
+            root.write_text("x = nope\n")
+            assert _wait_for(lambda: errors)
+        assert watcher.snapshot is before
+        assert isinstance(watcher.last_error, hyprlang.HyprlangError)
+
+        root.write_text("x = 5\n")
+        assert watcher.reload()
+        assert watcher.snapshot.values == {"x": 5, "y": 0}
+        assert watcher.last_error is None
+
+
+class TestAsync:
+    def test_aparse_string(self):
+        result = asyncio.run(hyprlang.aparse_string("x = 1", {"x": 0}))
+        assert result == {"x": 1}
+
+    def test_aparse_file(self, tmp_path):
+        path = tmp_path / "a.conf"
+        path.write_text("x = 2\n")
+        assert asyncio.run(hyprlang.aparse_file(str(path), {"x": 0})) == {"x": 2}
+
+    def test_config_aparse(self):
+        async def run():
+            config = hyprlang.Config("x = 1", is_stream=True)
+            config.add("x", 0)
+            config.commence()
+            await config.aparse()
+            await config.aparse_dynamic("x = 4")
+            with pytest.raises(hyprlang.HyprlangError):
+                await config.aparse_dynamic("nope = 1")
+            return config["x"]
+
+        assert asyncio.run(run()) == 4
+
+    @pytest.mark.parametrize("polling", [False, True])
+    def test_async_reload_events(self, tmp_path, polling):
+        root = tmp_path / "main.conf"
+        root.write_text("x = 1\n")
+        watcher = hyprlang.ConfigWatcher(
+            str(root), {"x": 0}, debounce=0.02, poll_interval=0.02, polling=polling
+        )
+
+        async def run():
+            events = aiter(watcher)
+
+            async def edit():
+                await asyncio.sleep(0.05)
+                root.write_text("x = 2\n")
+
+            task = asyncio.create_task(edit())
+            snapshot = await asyncio.wait_for(anext(events), 5)
+            await task
+            await events.aclose()
+            return snapshot
+
+        snapshot = asyncio.run(run())
+        assert snapshot.values == {"x": 2}
+        assert snapshot.generation == 1
+        assert watcher.snapshot is snapshot
+
+    def test_async_rescan_off_loop(self, tmp_path, monkeypatch):
+        root = tmp_path / "main.conf"
+        root.write_text("x = 1\n")
+        watcher = hyprlang.ConfigWatcher(
+            str(root), {"x": 0}, debounce=0.02, poll_interval=0.02, polling=True
+        )
+        threads = []
+        source_files = hyprlang._source_files
+
+        def record(path):
+            threads.append(threading.current_thread())
+            return source_files(path)
+
+        monkeypatch.setattr(hyprlang, "_source_files", record)
+
+        async def run():
+            events = aiter(watcher)
+
+            async def edit():
+                await asyncio.sleep(0.05)
+                root.write_text("x = 2\n")
+
+            task = asyncio.create_task(edit())
+            await asyncio.wait_for(anext(events), 5)
+            await task
+            await events.aclose()
+
+        asyncio.run(run())
+        assert threads
+        assert threading.main_thread() not in threads
+
+
+_real_parse_chunk = hyprlang._parse_chunk
+
+
+def _crashing_parse_chunk(paths):
+    if any(os.path.basename(path) == "crash.conf" for path in paths):
+        os._exit(1)
+    return _real_parse_chunk(paths)
+
+
+class TestParseMany:
+    @pytest.fixture
+    def paths(self, tmp_path):
+        paths = []
+        for i in range(10):
+            path = tmp_path / f"{i}.conf"
+            path.write_text(f"x = {i}\n")
+            paths.append(str(path))
+        (tmp_path / "3.conf").write_text("x = broken\n")
+        paths.append(str(tmp_path / "missing.conf"))
+        return paths
+
+    def test_schema_pickles(self):
+        import pickle
+
+        schema = hyprlang.Schema({"a": {"b": 1, "c": (1.5, 2.0)}, "d": "x"})
+        clone = pickle.loads(pickle.dumps(schema))
+        assert clone == schema
+        assert clone.keys == schema.keys
+
+    def test_ordered(self, paths):
+        outcomes = list(
+            hyprlang.parse_many(paths, {"x": 0}, processes=2, chunksize=3, max_pending=2)
+        )
+        assert [o.source for o in outcomes] == paths
+        assert [o.values["x"] for o in outcomes if o.ok] == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+        assert isinstance(outcomes[3].error, hyprlang.HyprlangError)
+        assert not outcomes[-1].ok
+
+    def test_as_completed(self, paths):
+        outcomes = list(
+            hyprlang.parse_many(paths, {"x": 0}, processes=2, chunksize=2, ordered=False)
+        )
+        assert sorted(o.source for o in outcomes) == sorted(paths)
+        assert sum(o.ok for o in outcomes) == 9
+
+    def test_worker_crash_fails_only_its_file(self, paths, tmp_path, monkeypatch):
+        crash = tmp_path / "crash.conf"
+        crash.write_text("x = 1\n")
+        paths.insert(5, str(crash))
+        monkeypatch.setattr(hyprlang, "_parse_chunk", _crashing_parse_chunk)
+        outcomes = list(hyprlang.parse_many(paths, {"x": 0}, processes=2, chunksize=4))
+        assert [o.source for o in outcomes] == paths
+        failed = [o.source for o in outcomes if not o.ok]
+        assert failed == [paths[3], str(crash), paths[-1]]
+        assert isinstance(outcomes[5].error, BrokenProcessPool)
+
+
+class TestIterParse:
+    def test_texts(self):
+        texts = [f"x = {i}" for i in range(20)] + ["x = bad"]
+        results = dict(hyprlang.iter_parse(texts, {"x": 0}, workers=3, is_stream=True))
+        assert len(results) == 21
+        assert results["x = 7"] == {"x": 7}
+        assert isinstance(results["x = bad"], hyprlang.HyprlangError)
+
+    def test_paths(self, tmp_path):
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"{i}.conf"
+            path.write_text(f"x = {i}\n")
+            paths.append(path)
+        results = dict(hyprlang.iter_parse(paths + [tmp_path / "nope.conf"], {"x": 0}))
+        assert results[paths[4]] == {"x": 4}
+        assert isinstance(results[tmp_path / "nope.conf"], hyprlang.HyprlangError)
+
+    def test_bounded_read_ahead(self):
+        pulled = []
+
+        def texts():
+            for i in range(1000):
+                pulled.append(i)
+                yield f"x = {i}"
+
+        results = hyprlang.iter_parse(texts(), {"x": 0}, workers=2, is_stream=True, max_pending=4)
+        next(results)
+        assert len(pulled) <= 5
+        results.close()
+        assert len(pulled) <= 5
+
+
 class TestParseStringErrors:
     """Test that genuinely invalid syntax raises an error."""
 
@@ -1,8 +1,24 @@
 """Tests for the low-level _core bindings."""
 
+import collections.abc
 import os
+import threading
+import time
 import pytest
-from hyprlang_pybind._core import Config, ConfigOptions, ParseResult, SVector2D
+from hyprlang_pybind._core import (
+    CompiledSchema,
+    Config,
+    ConfigOptions,
+    HandlerOptions,
+    NumericBuffer,
+    ParseResult,
+    SpecialCategoryOptions,
+    SVector2D,
+    ValueType,
+    infer_file_schema,
+    infer_schema,
+    source_files,
+)
 
 FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
 TEST_CONF = os.path.join(FIXTURES, "test.conf")
@@ -120,6 +136,195 @@ class TestConfigBasic:
         assert info_unset.set_by_user is False
         assert info_unset.value == 100
 
+    def test_get_values(self):
+        opts = ConfigOptions()
+        opts.path_is_stream = 1
+        config = Config("a = 1\nb = two", opts)
+        config.add_value("a", 0)
+        config.add_value("b", "")
+        config.commence()
+        config.parse()
+
+        assert config.get_values(["a", "b", "missing"]) == {
+            "a": 1,
+            "b": "two",
+            "missing": None,
+        }
+
+    def test_get_many(self):
+        opts = ConfigOptions()
+        opts.path_is_stream = 1
+        config = Config("a = 1", opts)
+        config.add_value("a", 0)
+        config.commence()
+        config.parse()
+
+        assert config.get_many(["a", "missing"]) == [1, None]
+        assert config.get_many(["a", "missing"], [5, "x"]) == [1, "x"]
+        with pytest.raises(ValueError):
+            config.get_many(["a"], [1, 2])
+
+    def test_add_values(self):
+        config = _stream_config("a = 1\nb = 2.5\nc = hi\nd = 1 2")
+        config.add_values([("a", 0), ("b", 0.0)])
+        config.add_values(["c", "d"], ["", (0.0, 0.0)])
+        config.commence()
+        assert not config.parse().error
+
+        assert config.snapshot() == {"a": 1, "b": 2.5, "c": "hi", "d": (1.0, 2.0)}
+
+    def test_add_values_errors(self):
+        config = _stream_config("")
+        with pytest.raises(ValueError):
+            config.add_values([("a", [])])
+        with pytest.raises(ValueError):
+            config.add_values(["a", "b"], [0])
+
+    def test_add_special_values(self):
+        config = _stream_config("dev[m] {\n  speed = 0.5\n  name = x\n}")
+        opts = SpecialCategoryOptions()
+        opts.set_key("key")
+        config.add_special_category("dev", opts)
+        config.add_special_values("dev", [("speed", 0.0), ("name", "")])
+        config.commence()
+        assert not config.parse().error
+
+        assert config.get_special_value("dev", "speed", "m") == 0.5
+        assert config.get_special_value("dev", "name", "m") == "x"
+
+    def test_special_table(self):
+        config = _stream_config(
+            "dev[a] {\n  speed = 0.5\n  size = 1 2\n}\ndev[b] {\n  name = y\n}"
+        )
+        opts = SpecialCategoryOptions()
+        opts.set_key("key")
+        config.add_special_category("dev", opts)
+        config.add_special_values(
+            "dev", [("speed", 0.0), ("size", SVector2D(0, 0)), ("name", "")]
+        )
+        config.commence()
+        assert not config.parse().error
+
+        keys, columns = config.get_special_table("dev")
+        assert keys == ["a", "b"]
+        assert columns["speed"] == [0.5, 0.0]
+        assert columns["name"] == ["", "y"]
+        assert columns["size"] == [(1.0, 2.0), (0.0, 0.0)]
+
+        keys, columns = config.get_special_table("dev", buffers=True)
+        assert isinstance(columns["speed"], NumericBuffer)
+        assert memoryview(columns["speed"]).tolist() == [0.5, 0.0]
+        assert memoryview(columns["size"]).shape == (2, 2)
+        assert columns["name"] == ["", "y"]
+
+    def test_special_table_anonymous(self):
+        config = _stream_config("rule {\n  n = 1\n}\nrule {\n  n = 2\n}")
+        opts = SpecialCategoryOptions()
+        opts.anonymous_key_based = True
+        config.add_special_category("rule", opts)
+        config.add_special_value("rule", "n", 0)
+        config.commence()
+        assert not config.parse().error
+
+        keys, columns = config.get_special_table("rule")
+        assert len(keys) == 2
+        assert columns == {"n": [1, 2]}
+
+        config.remove_special_value("rule", "n")
+        assert config.get_special_table("rule")[1] == {}
+
+    def test_add_schema(self):
+        schema = CompiledSchema([("a", 0), ("cat:b", "")])
+        assert schema.keys == ["a", "cat:b"]
+        assert schema.types == [ValueType.INT, ValueType.STRING]
+        assert schema.defaults == [0, ""]
+
+        for text in ("a = 1", "a = 2\ncat:b = x"):
+            config = _stream_config(text)
+            config.add_schema(schema)
+            config.commence()
+            assert not config.parse().error
+        assert config.snapshot() == {"a": 2, "cat": {"b": "x"}}
+
+    def test_snapshot(self):
+        opts = ConfigOptions()
+        opts.path_is_stream = 1
+        config = Config("top = 1\ncat {\n  a = 2\n  sub {\n    b = x\n  }\n}", opts)
+        config.add_value("top", 0)
+        config.add_value("cat:a", 0)
+        config.add_value("cat:sub:b", "")
+        config.commence()
+        config.parse()
+
+        assert config.snapshot() == {"top": 1, "cat": {"a": 2, "sub": {"b": "x"}}}
+        assert config.snapshot(flat=True) == {"top": 1, "cat:a": 2, "cat:sub:b": "x"}
+
+        config.parse_dynamic("cat:a = 3")
+        assert config.snapshot()["cat"]["a"] == 3
+
+    def test_changed_since(self):
+        config = _stream_config("a = 1\ncat {\n  b = 2\n}")
+        config.add_values([("a", 0), ("cat:b", 0), ("cat:c", "")])
+        config.commence()
+        config.parse()
+        gen = config.generation
+        assert config.changed_since(gen) == []
+
+        config.parse_dynamic("cat:b = 5")
+        assert config.generation > gen
+        assert config.changed_since(gen) == ["cat:b"]
+
+        # Re-setting the same value only flips set_by_user on unset keys.
+        config.parse_dynamic("a = 1")
+        assert config.changed_since(gen) == ["cat:b"]
+        config.parse_dynamic("cat:c = ")
+        assert config.changed_since(gen) == ["cat:b", "cat:c"]
+
+        config.parse()
+        assert config.changed_since(config.generation - 1) == ["cat:b", "cat:c"]
+
+    def test_changed_since_dynamic(self, tmp_path):
+        extra = tmp_path / "extra.conf"
+        extra.write_text("b = 4\n")
+        config = _stream_config("a = 1")
+        config.add_values([("a", 0), ("b", 0)])
+        config.register_handler("exec", lambda command, value: None)
+        config.commence()
+        config.parse()
+
+        gen = config.generation
+        config.parse_dynamic_kv("a", "2")
+        config.parse_dynamic("exec = true")
+        config.parse_dynamic("$X = 3")
+        assert config.changed_since(gen) == ["a"]
+
+        # A source line can assign anything, so every key is checked.
+        gen = config.generation
+        config.parse_dynamic(f"source = {extra}")
+        assert config.changed_since(gen) == ["b"]
+
+        gen = config.generation
+        config.parse_dynamic_many(["a = 5", "nope = 1"], rollback=True)
+        assert config.changed_since(gen) == []
+        config.parse_dynamic_many(["a = 5", "b = 6"])
+        assert config.changed_since(gen) == ["a", "b"]
+
+    def test_incremental_snapshot(self):
+        config = _stream_config("a = 1\ncat {\n  b = 2\n}")
+        config.add_values([("a", 0), ("cat:b", 0)])
+        config.commence()
+        config.parse()
+
+        nested = config.snapshot(incremental=True)
+        flat = config.snapshot(flat=True, incremental=True)
+        assert nested == {"a": 1, "cat": {"b": 2}}
+
+        config.parse_dynamic("cat:b = 7")
+        assert config.snapshot(incremental=True) is nested
+        assert nested == {"a": 1, "cat": {"b": 7}}
+        assert config.snapshot(flat=True, incremental=True) is flat
+        assert flat == {"a": 1, "cat:b": 7}
+
     def test_vec2(self):
         opts = ConfigOptions()
         opts.path_is_stream = 1
@@ -153,5 +358,587 @@ class TestConfigBasic:
         assert not result.error
 
 
+def _stream_config(text: str) -> Config:
+    opts = ConfigOptions()
+    opts.path_is_stream = 1
+    return Config(text, opts)
+
+
+class TestInferSchema:
+    def test_value_types(self):
+        text = "\n".join(
+            [
+                "a = yes",
+                "b = -12",
+                "c = 0xFF00aa",
+                "d = rgba(255, 0, 0, 1)",
+                "e = .5",
+                "f = 3.",
+                "g = 1 -2.5",
+                "h = hello world",
+                "i = 1.2.3",
+                "j = 0x",
+            ]
+        )
+        assert infer_schema(text) == {
+            "a": 0,
+            "b": 0,
+            "c": 0,
+            "d": 0,
+            "e": 0.0,
+            "f": 0.0,
+            "g": (0.0, 0.0),
+            "h": "",
+            "i": "",
+            "j": "",
+        }
+
+    def test_capture_schema(self, tmp_path):
+        path = tmp_path / "a.conf"
+        path.write_text("a = 3\ncat {\n  b = 1 2\n}\n")
+        config = Config(str(path), ConfigOptions())
+        assert config.capture_schema() == {"a": 0, "cat:b": (0.0, 0.0)}
+        config.commence()
+        assert not config.parse().error
+        assert config.get_value("a") == 3
+        assert config.get_value("cat:b") == (1.0, 2.0)
+
+    def test_file_follows_sources(self, tmp_path):
+        (tmp_path / "conf.d").mkdir()
+        (tmp_path / "conf.d" / "b.conf").write_text("b = 1.5\n")
+        (tmp_path / "conf.d" / "c.conf").write_text("c = x\nsource = d.conf\n")
+        (tmp_path / "conf.d" / "d.conf").write_text("d = 3\n")
+        (tmp_path / "vars.conf").write_text("v = 1\n")
+        root = tmp_path / "main.conf"
+        root.write_text(
+            "a = 1\nsource = conf.d/[bc].conf\nz = 2\n"
+            "$NAME = vars\nsource = $NAME.conf\nsource = missing.conf\n"
+        )
+        conf_d = tmp_path / "conf.d"
+
+        schema, graph = infer_file_schema(str(root))
+        assert list(schema) == ["a", "b", "c", "d", "z", "v"]
+        assert schema["b"] == 0.0
+        # Relative sources resolve against the file with the source line.
+        assert graph[str(conf_d / "c.conf")] == [str(conf_d / "d.conf")]
+        assert list(graph) == [
+            str(root),
+            str(conf_d / "b.conf"),
+            str(conf_d / "c.conf"),
+            str(conf_d / "d.conf"),
+            str(tmp_path / "vars.conf"),
+        ]
+        assert graph[str(root)][-2:] == [str(tmp_path / "vars.conf"), str(tmp_path / "missing.conf")]
+        assert source_files(str(root))[-1] == str(tmp_path / "missing.conf")
+
+        (conf_d / "b.conf").write_text("b = 1 2\nb2 = 0\n")
+        schema, _ = infer_file_schema(str(root))
+        assert schema["b"] == (0.0, 0.0)
+        assert "b2" in schema
+
+    def test_structure(self):
+        text = (
+            "$var = 1\nsource = other.conf\n"
+            "top = 1 # comment\n"
+            "dev[m] {\n  speed = 0.5\n  sub {\n    x = a\n  }\n}\n"
+            "empty =\ntop = x\n"
+        )
+        schema = infer_schema(text)
+        assert list(schema) == ["top", "dev:speed", "dev:sub:x"]
+        assert schema["top"] == ""
+
+
+class TestParseDynamicMany:
+    def _config(self):
+        config = _stream_config("a = 1\ndev[m] {\n  speed = 0.25\n}")
+        config.add_values([("a", 0), ("b", 0.0), ("c", "")])
+        opts = SpecialCategoryOptions()
+        opts.set_key("key")
+        config.add_special_category("dev", opts)
+        config.add_special_value("dev", "speed", 0.0)
+        config.commence()
+        assert not config.parse().error
+        return config
+
+    def test_applies_all_lines(self):
+        config = self._config()
+        results = config.parse_dynamic_many(["b = 1.5", "nope = 1", "c = x"])
+        assert [r.error for r in results] == [False, True, False]
+        assert config.get_value("b") == 1.5
+        assert config.get_value("c") == "x"
+
+    def test_rollback(self):
+        config = self._config()
+        results = config.parse_dynamic_many(
+            ["a = 5", "b = 0.1", "dev[m]:speed = 2", "c = y", "nope = 1"],
+            rollback=True,
+        )
+        assert results[-1].error
+        assert config.get_value("a") == 1
+        assert config.get_value("b") == 0.0
+        assert config.get_value("c") == ""
+        assert config.get_special_value("dev", "speed", "m") == 0.25
+        assert config.get_value_info("a").set_by_user
+        assert not config.get_value_info("b").set_by_user
+
+    def test_rollback_special_after_reparses(self):
+        config = _stream_config("dev[m] {\n  a = 1\n  b = hi\n  c = 0.5\n}")
+        opts = SpecialCategoryOptions()
+        opts.set_key("key")
+        config.add_special_category("dev", opts)
+        config.add_special_values("dev", [("a", 0), ("b", ""), ("c", 0.0)])
+        config.commence()
+        for _ in range(5):
+            assert not config.parse().error
+            config.parse_dynamic_many(
+                ["dev[m]:a = 5", "dev[m]:b = longer text", "dev[m]:c = 2", "nope = 1"],
+                rollback=True,
+            )
+            assert config.get_special_value("dev", "a", "m") == 1
+            assert config.get_special_value("dev", "b", "m") == "hi"
+            assert config.get_special_value("dev", "c", "m") == 0.5
+
+    def test_rollback_string_verbatim(self):
+        config = _stream_config("c = a ## b $W")
+        config.add_value("c", "")
+        config.commence()
+        assert not config.parse().error
+        assert config.get_value("c") == "a # b $W"
+        config.parse_dynamic_many(["c = a much longer value", "nope = 1"], rollback=True)
+        assert config.get_value("c") == "a # b $W"
+        config.parse_dynamic_many(["c = x", "nope = 1"], rollback=True)
+        assert config.get_value("c") == "a # b $W"
+
+    def test_rollback_success_keeps_values(self):
+        config = self._config()
+        results = config.parse_dynamic_many(["a = 5", "b = 0.1"], rollback=True)
+        assert not any(r.error for r in results)
+        assert config.get_value("a") == 5
+        assert config.get_value("b") == pytest.approx(0.1)
+
+
+class TestValueCache:
+    def test_reuses_unchanged_values(self):
+        config = _stream_config("s = some/long/path\nt = some/long/path\ni = 5")
+        config.add_values([("s", ""), ("t", ""), ("i", 0)])
+        config.commence()
+        config.parse()
+
+        first = config.get_value("s")
+        assert config.get_value("s") is first
+        # Equal strings are interned across keys.
+        assert config.get_value("t") is first
+
+        config.parse()
+        assert config.get_value("s") is first
+
+        stats = config.cache_stats()
+        assert stats["hits"] >= 2
+        assert stats["misses"] >= 2
+        assert stats["intern_hits"] >= 1
+
+    def test_invalidated_on_change(self):
+        config = _stream_config("s = a\nv = 1 2")
+        config.add_values([("s", ""), ("v", (0.0, 0.0))])
+        config.commence()
+        config.parse()
+        assert config.get_value("s") == "a"
+        assert config.get_value("v") == (1.0, 2.0)
+
+        config.parse_dynamic("s = b")
+        config.parse_dynamic("v = 3 4")
+        assert config.get_value("s") == "b"
+        assert config.get_value("v") == (3.0, 4.0)
+
+    def test_special_values(self):
+        config = _stream_config("dev[a] {\n  name = x\n}\ndev[b] {\n  name = x\n}")
+        opts = SpecialCategoryOptions()
+        opts.set_key("key")
+        config.add_special_category("dev", opts)
+        config.add_special_value("dev", "name", "")
+        config.commence()
+        config.parse()
+
+        a = config.get_special_value("dev", "name", "a")
+        assert a == "x"
+        assert config.get_special_value("dev", "name", "b") is a
+        config.parse()
+        assert config.get_special_value("dev", "name", "a") == "x"
+
+
+class TestNumericExport:
+    def _config(self):
+        config = _stream_config("a = 3\nb = 0.5\nv = 1 2\nw = 3 4\ns = x")
+        config.add_values(
+            [("a", 0), ("b", 0.0), ("s", ""), ("v", (0.0, 0.0)), ("w", (0.0, 0.0))]
+        )
+        config.commence()
+        config.parse()
+        return config
+
+    def test_all_keys(self):
+        exp = self._config().export_numeric()
+        assert exp.int_keys == ["a"]
+        assert exp.float_keys == ["b"]
+        assert exp.vec2_keys == ["v", "w"]
+
+        ints = memoryview(exp.ints)
+        assert ints.itemsize == 8
+        assert ints.tolist() == [3]
+        assert memoryview(exp.floats).tolist() == [0.5]
+        vec2s = memoryview(exp.vec2s)
+        assert vec2s.format == "f"
+        assert vec2s.shape == (2, 2)
+        assert vec2s.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_selected_keys(self):
+        config = self._config()
+        exp = config.export_numeric(["w", "s", "a"])
+        assert exp.int_keys == ["a"]
+        assert exp.float_keys == []
+        assert len(exp.floats) == 0
+        assert exp.vec2_keys == ["w"]
+        with pytest.raises(RuntimeError):
+            config.export_numeric(["missing"])
+
+    def test_read_after_export(self):
+        # export_numeric caches value types without converting the values.
+        config = _stream_config("")
+        config.add_values([("a", 0), ("b", 0.5)])
+        config.commence()
+        config.parse()
+        config.export_numeric()
+        assert config.get_value("a") == 0
+        assert config.get_value("b") == 0.5
+
+
+class TestHandles:
+    def test_value_tracks_parses(self):
+        config = _stream_config("a = 1\ns = hi\nv = 1 2")
+        config.add_value("a", 0)
+        config.add_value("s", "")
+        config.add_value("v", SVector2D(0.0, 0.0))
+        config.add_value("unset", 3.5)
+        config.commence()
+        config.parse()
+
+        a = config.get_handle("a")
+        assert a.value == 1
+        assert a.set_by_user is True
+        assert config.get_handle("s").value == "hi"
+        assert config.get_handle("v").value == (1.0, 2.0)
+        assert config.get_handle("unset").value == 3.5
+        assert config.get_handle("unset").set_by_user is False
+
+        config.parse_dynamic("a = 7")
+        assert a.value == 7
+
+    def test_missing(self):
+        config = _stream_config("")
+        config.commence()
+        with pytest.raises(RuntimeError):
+            config.get_handle("nope")
+
+    def test_special(self):
+        config = _stream_config("dev[m] {\n  speed = 0.5\n}")
+        opts = SpecialCategoryOptions()
+        opts.set_key("key")
+        config.add_special_category("dev", opts)
+        config.add_special_value("dev", "speed", 0.0)
+        config.commence()
+        config.parse()
+
+        speed = config.get_special_handle("dev", "speed", "m")
+        assert speed.value == 0.5
+        config.parse()
+        assert speed.value == 0.5
+
+    @pytest.mark.parametrize("removal", ["category", "value"])
+    def test_special_after_removal(self, removal):
+        config = _stream_config("dev[m] {\n  speed = 0.5\n}")
+        opts = SpecialCategoryOptions()
+        opts.set_key("key")
+        config.add_special_category("dev", opts)
+        config.add_special_value("dev", "speed", 0.0)
+        config.commence()
+        config.parse()
+
+        speed = config.get_special_handle("dev", "speed", "m")
+        assert speed.value == 0.5
+        if removal == "category":
+            config.remove_special_category("dev")
+        else:
+            config.remove_special_value("dev", "speed")
+            config.parse()
+        assert speed.value is None
+        assert speed.set_by_user is None
+
+    def test_keeps_config_alive(self):
+        config = _stream_config("a = 4")
+        config.add_value("a", 0)
+        config.commence()
+        config.parse()
+        handle = config.get_handle("a")
+        del config
+        assert handle.value == 4
+
+
+class TestConfigView:
+    def _config(self):
+        config = _stream_config("a = 1\ncat {\n  b = hi\n}")
+        config.add_values([("a", 0), ("cat:b", ""), ("cat:c", 2.5)])
+        config.commence()
+        config.parse()
+        return config
+
+    def test_mapping(self):
+        view = self._config().view()
+        assert isinstance(view, collections.abc.Mapping)
+        assert list(view.keys()) == ["a", "cat"]
+        assert dict(view["cat"].items()) == {"b": "hi", "c": 2.5}
+        assert view.get("missing", 5) == 5
+        assert "cat" in view and "b" not in view
+
+    def test_values_follow_parses(self):
+        config = self._config()
+        view = config.view()
+        cat = view["cat"]
+        config.parse_dynamic("a = 7")
+        assert view["a"] == 7
+        assert view["cat"] is cat
+
+    def test_keeps_config_alive(self):
+        view = self._config().view()
+        assert view["cat"]["b"] == "hi"
+
+
+class TestHandlers:
+    def test_per_line(self):
+        config = _stream_config("bind = SUPER, Q, exec, kitty\nbind = SUPER, M, exit\nx = 1")
+        config.add_value("x", 0)
+        seen = []
+        config.register_handler("bind", lambda cmd, val: seen.append((cmd, val)))
+        config.commence()
+
+        result = config.parse()
+        assert not result.error, result.error_message
+        assert seen == [
+            ("bind", "SUPER, Q, exec, kitty"),
+            ("bind", "SUPER, M, exit"),
+        ]
+        assert config.get_value("x") == 1
+
+    def test_error_string(self):
+        config = _stream_config("exec = bad")
+        config.register_handler("exec", lambda cmd, val: "nope")
+        config.commence()
+
+        result = config.parse()
+        assert result.error
+        assert "nope" in result.error_message
+
+    def test_exception(self):
+        def boom(cmd, val):
+            raise ValueError("boom")
+
+        config = _stream_config("exec = x")
+        config.register_handler("exec", boom)
+        config.commence()
+
+        result = config.parse()
+        assert result.error
+        assert "boom" in result.error_message
+
+    def test_flags(self):
+        config = _stream_config("bindm = SUPER, mouse:272, movewindow")
+        opts = HandlerOptions()
+        opts.allow_flags = True
+        seen = []
+        config.register_handler("bind", lambda cmd, val: seen.append(cmd), opts)
+        config.commence()
+
+        assert not config.parse().error
+        assert seen == ["bindm"]
+
+    def test_batch(self):
+        config = _stream_config("exec = a\nexec = b\nexec = c")
+        batches = []
+        config.register_handler("exec", batches.append, batch=True)
+        config.commence()
+
+        assert not config.parse().error
+        assert batches == [[("exec", "a"), ("exec", "b"), ("exec", "c")]]
+
+        assert not config.parse_dynamic("exec = d").error
+        assert batches[-1] == [("exec", "d")]
+
+    def test_batch_error(self):
+        config = _stream_config("exec = a")
+        config.register_handler("exec", lambda lines: "rejected", batch=True)
+        config.commence()
+
+        result = config.parse()
+        assert result.error
+        assert "rejected" in result.error_message
+
+    def test_unregister(self):
+        config = _stream_config("exec = a")
+        config.register_handler("exec", lambda cmd, val: None)
+        config.unregister_handler("exec")
+        config.commence()
+
+        assert config.parse().error
+
+
+class TestCollectors:
+    def test_collect_raw(self):
+        config = _stream_config("windowrule = float, kitty\nwindowrule = tile, foot")
+        config.add_collector("windowrule")
+        config.commence()
+
+        assert not config.parse().error
+        assert config.get_collected("windowrule") == [
+            ("windowrule", "float, kitty"),
+            ("windowrule", "tile, foot"),
+        ]
+
+    def test_split_args(self):
+        config = _stream_config("bind = SUPER , Q,exec, kitty -e a,b")
+        config.add_collector("bind", split_args=True, max_args=4)
+        config.commence()
+
+        assert not config.parse().error
+        assert config.get_collected("bind") == [
+            ("bind", ("SUPER", "Q", "exec", "kitty -e a,b")),
+        ]
+
+    def test_reset_on_parse(self):
+        config = _stream_config("exec-once = waybar")
+        config.add_collector("exec-once")
+        config.commence()
+
+        config.parse()
+        config.parse_dynamic("exec-once = mako")
+        assert len(config.get_collected("exec-once")) == 2
+        config.parse()
+        assert config.get_collected("exec-once") == [("exec-once", "waybar")]
+
+    def test_unknown_collector(self):
+        config = _stream_config("")
+        with pytest.raises(IndexError):
+            config.get_collected("bind")
+
+
+def _big_stream_config(lines: int = 20000) -> Config:
+    opts = ConfigOptions()
+    opts.path_is_stream = 1
+    text = "\n".join(f"cat {{\n  v{i % 100} = {i}\n}}" for i in range(lines))
+    config = Config(text, opts)
+    for i in range(100):
+        config.add_value(f"cat:v{i}", 0)
+    config.commence()
+    return config
+
+
+class TestThreading:
+    def test_parse_releases_gil(self):
+        config = _big_stream_config(50000)
+        window = []
+
+        def worker():
+            window.append(time.perf_counter())
+            config.parse()
+            window.append(time.perf_counter())
+
+        ticks = []
+        t = threading.Thread(target=worker)
+        t.start()
+        while t.is_alive():
+            ticks.append(time.perf_counter())
+            time.sleep(0.0005)
+        t.join()
+
+        start, end = window
+        inside = [start, *(x for x in ticks if start < x < end), end]
+        longest_gap = max(b - a for a, b in zip(inside, inside[1:]))
+        # With the GIL held, the main thread would stall for the whole parse.
+        assert longest_gap < (end - start) / 2
+        assert config.get_value("cat:v99") == 49999
+
+    def test_reads_wait_for_parse(self):
+        config = _stream_config("a = 1\nexec = x")
+        config.add_value("a", 0)
+        entered, release = threading.Event(), threading.Event()
+
+        def on_exec(lines):
+            # Runs inside the parse, which still holds the Config.
+            assert config.get_value("a") == 1
+            entered.set()
+            release.wait(5)
+
+        config.register_handler("exec", on_exec, batch=True)
+        config.commence()
+        parser = threading.Thread(target=config.parse)
+        parser.start()
+        assert entered.wait(5)
+
+        reads = []
+        reader = threading.Thread(target=lambda: reads.append(config.get_value("a")))
+        reader.start()
+        reader.join(0.2)
+        assert reader.is_alive() and not reads
+        release.set()
+        parser.join()
+        reader.join()
+        assert reads == [1]
+
+    @pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="needs 4+ CPUs")
+    def test_parallel_parse_throughput(self):
+        workers = 4
+        configs = [_big_stream_config() for _ in range(workers * 2)]
+
+        start = time.perf_counter()
+        for config in configs:
+            config.parse()
+        serial = time.perf_counter() - start
+
+        threads = [
+            threading.Thread(target=lambda c=c: c.parse()) for c in configs
+        ]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        parallel = time.perf_counter() - start
+
+        assert parallel < serial * 0.75, (serial, parallel)
+
+
+def _rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+class TestMemory:
+    @pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="needs /proc")
+    def test_many_configs_flat_rss(self):
+        def churn(n):
+            for _ in range(n):
+                config = _stream_config("a = 1")
+                config.add_value("a", 0)
+                config.add_value("b", "text")
+                opts = SpecialCategoryOptions()
+                opts.set_key("name")
+                config.add_special_category("dev", opts)
+                config.add_special_value("dev", "name", "")
+                config.register_handler("bind", lambda cmd, val: None)
+
+        churn(10000)
+        before = _rss()
+        churn(100000)
+        assert _rss() - before < 2 * 1024 * 1024
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])